@@ -2,12 +2,29 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Colormap, Normalize
 import matplotlib.pyplot as pl
 import pandas as pd
 
 from cubetime.core.TimedTask import TimedTask
 from cubetime.core.TimeSet import TimeSet
 
+TICK_STYLE: Dict[str, float] = {
+    f"{axis}tick.{key}": value
+    for axis in "xy"
+    for (key, value) in {
+        "labelsize": 12,
+        "major.width": 2.5,
+        "major.size": 7.5,
+        "minor.width": 1.5,
+        "minor.size": 4.5,
+    }.items()
+}
+"""matplotlib rcParams applied to all plots, so ticks are styled when created."""
+CORRELATION_COLORMAP: Colormap = pl.get_cmap("seismic")
+"""Colormap used to show correlations, which always lie in the range [-1, 1]."""
+
 
 class PlotType(Enum):
     """Enumeration representing types of plots that can be performed."""
@@ -57,12 +74,7 @@ class PlotType(Enum):
         Returns:
             label for x axis of plot
         """
-        label: str = ""
-        if self == PlotType.HISTOGRAM:
-            label = f"{'cumulative ' if cumulative else ''}completion time [s]"
-        elif self == PlotType.SCATTER:
-            label = "completion #"
-        return label
+        return _XLABELS[self][int(cumulative)]
 
     def make_ylabel(self, cumulative: bool) -> str:
         """
@@ -74,12 +86,7 @@ class PlotType(Enum):
         Returns:
             label for y axis of plot
         """
-        label: str = ""
-        if self == PlotType.HISTOGRAM:
-            label = "# of occurrences"
-        elif self == PlotType.SCATTER:
-            label = f"{'cumulative' if cumulative else ''}completion time [s]"
-        return label
+        return _YLABELS[self][int(cumulative)]
 
     def make_title(
         self, taskname: str, segments: Optional[List[Tuple[int, str]]], cumulative: bool
@@ -95,22 +102,60 @@ class PlotType(Enum):
         Returns:
             string title
         """
-        title: str = ""
-        if self == PlotType.HISTOGRAM:
-            title = " time distribution"
-        elif self == PlotType.SCATTER:
-            title = " time progression"
         if segments is None:
-            title = f"{taskname}{title}"
+            return f"{taskname}{_TITLE_SUFFIXES[self]}"
+        elif len(segments) == 1:
+            return self._single_segment_title(taskname, segments[0][1], cumulative)
         else:
-            title = f"{title}, {taskname}"
-            if len(segments) == 1:
-                title = f"{segments[0][1]}{title}"
-            else:
-                title = f"Segment{title}"
-            if cumulative:
-                title = f"Cumulative {title[0].lower()}{title[1:]}"
-        return title
+            return self._multi_segment_title(taskname, cumulative)
+
+    def _single_segment_title(
+        self, taskname: str, segment: str, cumulative: bool
+    ) -> str:
+        """
+        Creates the title of a plot of this type showing one segment.
+
+        Args:
+            taskname: string name of the task with times being plotted
+            segment: name of the segment being plotted
+            cumulative: true if cumulative times being plotted (false for standalone)
+
+        Returns:
+            string title
+        """
+        prefix: str = "Cumulative " if cumulative else ""
+        return f"{prefix}{segment}{_TITLE_SUFFIXES[self]}, {taskname}"
+
+    def _multi_segment_title(self, taskname: str, cumulative: bool) -> str:
+        """
+        Creates the title of a plot of this type showing multiple segments.
+
+        Args:
+            taskname: string name of the task with times being plotted
+            cumulative: true if cumulative times being plotted (false for standalone)
+
+        Returns:
+            string title
+        """
+        prefix: str = "Cumulative segment" if cumulative else "Segment"
+        return f"{prefix}{_TITLE_SUFFIXES[self]}, {taskname}"
+
+
+_XLABELS: Dict[PlotType, Tuple[str, str]] = {
+    PlotType.HISTOGRAM: ("completion time [s]", "cumulative completion time [s]"),
+    PlotType.SCATTER: ("completion #", "completion #"),
+}
+"""x-axis labels of each plot type, indexed by whether times are cumulative."""
+_YLABELS: Dict[PlotType, Tuple[str, str]] = {
+    PlotType.HISTOGRAM: ("# of occurrences", "# of occurrences"),
+    PlotType.SCATTER: ("completion time [s]", "cumulative completion time [s]"),
+}
+"""y-axis labels of each plot type, indexed by whether times are cumulative."""
+_TITLE_SUFFIXES: Dict[PlotType, str] = {
+    PlotType.HISTOGRAM: " time distribution",
+    PlotType.SCATTER: " time progression",
+}
+"""Text following the task/segment name in the titles of each plot type."""
 
 
 class TimePlotter:
@@ -130,14 +175,38 @@ class TimePlotter:
         time_set: TimeSet = timed_task.time_set
         self.name: str = timed_task.name
         self.segments: Optional[List[Tuple[int, str]]] = None
-        self.times: pd.DataFrame = time_set.cumulative_times[[time_set.segments[-1]]]
-        if segments is not None:
+        # one column per plotted segment, column-major so each column is contiguous
+        self.times: np.ndarray
+        if segments is None:
+            self.times = np.array(time_set.cumulative_values[:, -1:], order="F")
+        else:
             self.segments = []
             for segment in segments:
                 self.segments.append((time_set.segments.index(segment), segment))
-            self.times = time_set.cumulative_times if cumulative else time_set.times
+            frame: pd.DataFrame = (
+                time_set.cumulative_times if cumulative else time_set.times
+            )[segments]
+            self.times = np.asfortranarray(frame.to_numpy(dtype=np.float64))
         self.cumulative: bool = cumulative and (segments is not None)
+        self._titles: Dict[PlotType, str] = {}
+
+    def title(self, plot_type: PlotType) -> str:
+        """
+        Gets the title of plots of the given type made by this plotter.
+
+        Args:
+            plot_type: the type of plot being made
+
+        Returns:
+            string title, which is only created once per plot type
+        """
+        if plot_type not in self._titles:
+            self._titles[plot_type] = plot_type.make_title(
+                taskname=self.name, segments=self.segments, cumulative=self.cumulative
+            )
+        return self._titles[plot_type]
 
+    @pl.rc_context(TICK_STYLE)
     def plot(
         self,
         plot_type: PlotType,
@@ -155,34 +224,34 @@ class TimePlotter:
             **extra_kwargs: keyword arguments to pass to matplotlib plotting function
         """
         fontsize: int = 12
-        fig = pl.figure(figsize=(12, 9))
-        ax = fig.add_subplot(111)
+        (fig, ax) = pl.subplots(figsize=(12, 9))
         kwargs: Dict[str, Any] = plot_type.default_kwargs
         kwargs.update(extra_kwargs)
         if self.segments is None:
-            plot_type.single_plot(ax, self.times.iloc[:, 0], **kwargs)
+            plot_type.single_plot(ax, self.times[:, 0], **kwargs)
         else:
-            for (segment_index, segment) in self.segments:
+            for (column, (segment_index, segment)) in enumerate(self.segments):
                 kwargs["label"] = f"{1 + segment_index}. {segment}"
-                plot_type.single_plot(ax, self.times[segment].values, **kwargs)
+                plot_type.single_plot(ax, self.times[:, column], **kwargs)
             if len(self.segments) > 1:
                 ax.legend(fontsize=fontsize)
-        title: str = plot_type.make_title(
-            taskname=self.name, segments=self.segments, cumulative=self.cumulative
-        )
-        ax.set_title(title, size=fontsize)
+        ax.set_title(self.title(plot_type), size=fontsize)
         ax.set_xlabel(plot_type.make_xlabel(cumulative=self.cumulative), size=fontsize)
         ax.set_ylabel(plot_type.make_ylabel(cumulative=self.cumulative), size=fontsize)
-        ax.tick_params(labelsize=fontsize, width=2.5, length=7.5, which="major")
-        ax.tick_params(width=1.5, length=4.5, which="minor")
         fig.tight_layout()
-        if file_name is not None:
-            fig.savefig(file_name)
+        try:
+            if file_name is not None:
+                fig.savefig(file_name)
+        finally:
+            if headless:
+                # nothing will be shown, so release the figure even if saving failed
+                pl.close(fig)
         if not headless:
             pl.show()
         return
 
 
+@pl.rc_context(TICK_STYLE)
 def plot_correlations(
     timed_task: TimedTask, segments: List[str] = None, **kwargs
 ) -> None:
@@ -204,11 +273,13 @@ def plot_correlations(
     ax = fig.add_subplot(111)
     single_dim_extent: Tuple[float, float] = (-0.5, num_segments - 0.5)
     extent = single_dim_extent + single_dim_extent[-1::-1]
-    kwargs.update(
-        dict(interpolation="none", extent=extent, vmin=-1, vmax=1, cmap="seismic")
+    kwargs.update(dict(interpolation="none", extent=extent))
+    # colors are looked up directly since the range of correlations is always fixed
+    ax.imshow(CORRELATION_COLORMAP((correlation + 1) / 2), **kwargs)
+    pl.colorbar(
+        ScalarMappable(norm=Normalize(vmin=-1, vmax=1), cmap=CORRELATION_COLORMAP),
+        ax=ax,
     )
-    image = ax.imshow(correlation, **kwargs)
-    colorbar = pl.colorbar(image, ax=ax)
     ax.set_xlabel("segment", size=fontsize)
     ax.set_ylabel("segment", size=fontsize)
     ax.set_title(f"{taskname} segment time correlations", size=fontsize)
@@ -217,8 +288,6 @@ def plot_correlations(
     ax.set_xticklabels(segments)
     ax.set_yticks(ticks)
     ax.set_yticklabels(segments)
-    ax.tick_params(labelsize=fontsize, width=2.5, length=7.5)
-    colorbar.ax.tick_params(labelsize=fontsize, width=2.5, length=7.5)
     fig.tight_layout()
     pl.show()
     return
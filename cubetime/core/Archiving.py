@@ -2,9 +2,11 @@ from datetime import datetime
 import logging
 import os
 import shutil
+import tempfile
 from typing import Dict, Optional
 
 from cubetime.core.Config import global_config
+from cubetime.core.TaskIndex import TASK_CACHE_FILE_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +36,18 @@ def make_data_snapshot(filename: str, force: bool = False) -> None:
             "filename given to make_data_snapshot dit not have one of "
             f"the following extensions: {sorted(extension_to_type)}."
         )
-    shutil.make_archive(filename, archive_type, global_config["data_directory"])
+    data_directory: str = global_config["data_directory"]
+    # the data directory isn't created until the first task is added
+    os.makedirs(data_directory, exist_ok=True)
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        # the task cache is rebuilt from the task configs, so it isn't archived
+        to_archive: str = os.path.join(temporary_directory, "data")
+        shutil.copytree(
+            data_directory,
+            to_archive,
+            ignore=shutil.ignore_patterns(TASK_CACHE_FILE_NAME),
+        )
+        shutil.make_archive(filename, archive_type, to_archive)
     timestamp = datetime.now().strftime(r"%H:%M:%S, %d %b, %Y")
     logger.info(f"Saved snapshot of data at {timestamp} to {filename}{extension}.")
     return
@@ -1,12 +1,32 @@
-from enum import Enum
+from enum import Enum, IntEnum
+import math
 import numpy as np
-from typing import Callable, Optional
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
 from typing_extensions import Self
 
 from cubetime.core.Formatting import make_time_string
 
-COLOR_DICT = {"red": 31, "yellow": 33, "green": 32, "white": 37}
-"""Integers to place in terminal formatting strings for colors used in printing."""
+
+class Color(IntEnum):
+    """Colors used in printing, valued by the integer used in terminal formatting."""
+
+    RED = 31
+    GREEN = 32
+    YELLOW = 33
+    WHITE = 37
+
+
+TERMINAL_FORMAT_PREFIXES: Dict[Tuple[Color, bool], str] = {
+    (color, bold): f"\033[{'1;' if bold else ''}{color.value}m"
+    for color in Color
+    for bold in [False, True]
+}
+"""Escape sequences that start terminal formatting, keyed by (color, bold)."""
+TERMINAL_FORMAT_SUFFIX: str = "\033[00m"
+"""Escape sequence that resets terminal formatting."""
+EMPTY_COMPARE_DATA: np.ndarray = np.empty(0, dtype=np.float64)
+EMPTY_COMPARE_DATA.flags.writeable = False
+"""Data of CompareTime objects that have no times to compare to."""
 
 
 class CompareResultDiscrete(Enum):
@@ -17,19 +37,13 @@ class CompareResultDiscrete(Enum):
     BETTER = 2
 
 
-class CompareResult:
+class CompareResult(NamedTuple):
     """Class storing discrete comparison and numerical comparison of times."""
 
-    def __init__(self, discrete: CompareResultDiscrete, continuous: float):
-        """
-        Stores the result of a time comparison.
-
-        Args:
-            discrete: equal, better, or worse
-            continuous: numerical difference, (current - comparison)
-        """
-        self.discrete: CompareResultDiscrete = discrete
-        self.continuous: float = continuous
+    discrete: CompareResultDiscrete
+    """equal, better, or worse"""
+    continuous: float
+    """numerical difference, (current - comparison)"""
 
     def __str__(self) -> str:
         """
@@ -40,12 +54,12 @@ class CompareResult:
             preprended if positive if numerical comparison available. If no
             numerical comparison is available, empty string is returned.
         """
-        if np.isnan(self.continuous):
+        if math.isnan(self.continuous):
             return " (????)"
         return f" ({make_time_string(self.continuous, show_plus=True)})"
 
 
-def comparison_color(current: CompareResult, best: CompareResult) -> str:
+def comparison_color(current: CompareResult, best: CompareResult) -> Color:
     """
     Determines the color that should be used based on current and best comparisons.
 
@@ -54,16 +68,16 @@ def comparison_color(current: CompareResult, best: CompareResult) -> str:
         best: the best comparison, which determines yellow v non-yellow
 
     Returns:
-        color string
+        the Color to print the comparison in
     """
     if best.discrete == CompareResultDiscrete.BETTER:
-        return "yellow"
+        return Color.YELLOW
     elif current.discrete == CompareResultDiscrete.BETTER:
-        return "green"
+        return Color.GREEN
     elif current.discrete == CompareResultDiscrete.WORSE:
-        return "red"
+        return Color.RED
     else:
-        return "white"
+        return Color.WHITE
 
 
 class CompareTime:
@@ -76,7 +90,12 @@ class CompareTime:
         Args:
             data: array of segment times if available or None otherwise
         """
-        self.data: Optional[np.ndarray] = data
+        self.empty: bool = data is None
+        self.data: np.ndarray = (
+            EMPTY_COMPARE_DATA
+            if self.empty
+            else np.ascontiguousarray(data, dtype=np.float64)
+        )
 
     def __eq__(self, other: Self) -> bool:
         """
@@ -88,20 +107,11 @@ class CompareTime:
         Returns:
             true if both objects have no data or if the data of both are equal
         """
-        if (self.data is None) != (other.data is None):
-            return False
-        if self.data is None:
+        if self is other:
             return True
-        if len(self.data) != len(other.data):
-            return False
-        this_data = self.data.astype(float)
-        other_data = other.data.astype(float)
-        where_nan = np.isnan(this_data)
-        if np.any(where_nan != np.isnan(other_data)):
-            return False
-        return np.all(
-            np.where(where_nan, 0, this_data) == np.where(where_nan, 0, other_data)
-        )
+        if self.empty or other.empty:
+            return self.empty and other.empty
+        return np.array_equal(self.data, other.data, equal_nan=True)
 
     def compare(
         self, segment_index: int, main_time: float, min_better: bool = True
@@ -117,10 +127,10 @@ class CompareTime:
         Returns:
             CompareResult determining how main_time relates to the times in this object
         """
-        if self.data is None:
+        if self.empty:
             return CompareResult(CompareResultDiscrete.EQUAL, np.nan)
         difference: float = main_time - self.data[segment_index]
-        if np.isnan(difference):
+        if math.isnan(difference):
             return CompareResult(CompareResultDiscrete.EQUAL, np.nan)
         elif difference == 0:
             return CompareResult(CompareResultDiscrete.EQUAL, difference)
@@ -130,19 +140,20 @@ class CompareTime:
             return CompareResult(CompareResultDiscrete.WORSE, difference)
 
 
-def terminal_format(string: str, color: str, bold: bool = False) -> str:
+def terminal_format(string: str, color: Color, bold: bool = False) -> str:
     """
     Formats a string to be printed in a specific color and bold status in terminal.
 
     Args:
         string: the string to format
-        color: one of "white", "red", "yellow", "green"
+        color: the color to print the text in
         bold: if True, text is bolded
 
     Returns:
         string such that when printed, shows text of parameter with given status
     """
-    return f"\033[{'1;' if bold else ''}{COLOR_DICT[color.lower()]}m{string}\033[00m"
+    prefix: str = TERMINAL_FORMAT_PREFIXES[(color, bold)]
+    return f"{prefix}{string}{TERMINAL_FORMAT_SUFFIX}"
 
 
 def compare_terminal_output(
@@ -171,18 +182,14 @@ def compare_terminal_output(
     best_segment_compare_result: CompareResult = best.compare(
         segment_index, time, min_better=min_best
     )
-    segment_color: str = comparison_color(
-        segment_compare_result, best_segment_compare_result
-    )
-    main_string: str = "????"
-    if not np.isnan(time):
-        main_string = make_time_string(time, show_plus=False)
-    compare_string: str = str(segment_compare_result)
-    return terminal_format(
-        f"{main_string}{compare_string}",
-        color=segment_color,
-        bold=True,
+    prefix: str = TERMINAL_FORMAT_PREFIXES[
+        (comparison_color(segment_compare_result, best_segment_compare_result), True)
+    ]
+    main_string: str = (
+        "????" if math.isnan(time) else make_time_string(time, show_plus=False)
     )
+    # formatting is inlined so the whole colored string is built in one step
+    return f"{prefix}{main_string}{segment_compare_result}{TERMINAL_FORMAT_SUFFIX}"
 
 
 class ComparisonSet:
@@ -222,12 +229,12 @@ class ComparisonSet:
         Returns:
             difference between the best and current values of the given segment
         """
-        if (self.best_segments.data is None) or (self.current_segments.data is None):
+        if self.best_segments.empty or self.current_segments.empty:
             return None
         best: float = self.best_segments.data[segment_index]
         current: float = self.current_segments.data[segment_index]
         save: float = (current - best) * (1 if self.min_best else (-1))
-        return None if np.isnan(save) else save
+        return None if math.isnan(save) else save
 
     def time_save_string(self, segment_index: int) -> str:
         """
@@ -243,9 +250,10 @@ class ComparisonSet:
         if (save := self.time_save(segment_index)) is None:
             return ""
         else:
+            save_string: str = make_time_string(save)
             return (
                 " (possible time save: "
-                f'{terminal_format(make_time_string(save), color="white", bold=True)})'
+                f"{terminal_format(save_string, color=Color.WHITE, bold=True)})"
             )
 
     def print_segment_terminal_output(
@@ -264,22 +272,26 @@ class ComparisonSet:
             cumulative: the cumulative time to the given segment
             print_func: the function used to print the output
         """
+        min_best: bool = self.min_best
         segment_time_string: str = compare_terminal_output(
             segment_index=segment_index,
             time=standalone,
             current=self.current_segments,
             best=self.best_segments,
-            min_best=self.min_best,
+            min_best=min_best,
         )
-        message: str = f"Segment time: {segment_time_string}"
         if segment_index > 0:
             cumulative_time_string: str = compare_terminal_output(
                 segment_index=segment_index,
                 time=cumulative,
                 current=self.current_cumulatives,
                 best=self.best_cumulatives,
-                min_best=self.min_best,
+                min_best=min_best,
+            )
+            print_func(
+                f"Segment time: {segment_time_string}, "
+                f"cumulative time: {cumulative_time_string}"
             )
-            message += f", cumulative time: {cumulative_time_string}"
-        print_func(message)
+        else:
+            print_func(f"Segment time: {segment_time_string}")
         return
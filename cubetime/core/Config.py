@@ -1,4 +1,6 @@
+import atexit
 from collections import defaultdict
+from functools import lru_cache
 import logging
 import os
 from pynput.keyboard import Key as KeyboardKey
@@ -11,7 +13,9 @@ from typing import (
     Iterator,
     List,
     NamedTuple,
+    Sequence,
     Set,
+    Tuple,
     Union,
 )
 import yaml
@@ -24,16 +28,25 @@ HOME_DIRECTORY = os.environ["HOME"]
 GLOBAL_CONFIG_FILENAME: str = f"{HOME_DIRECTORY}/.config/cubetime.yml"
 """Filename for the global config."""
 
+YAML_DUMPER: type = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+"""YAML dumper for the config file (libyaml C bindings when available)."""
 
-def _key_config_parser(string: str) -> List[Union[KeyboardKey, KeyboardKeyCode]]:
+YAML_LOADER: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""YAML loader for the config file (libyaml C bindings when available)."""
+
+
+@lru_cache(maxsize=64)
+def _key_config_parser(string: str) -> Tuple[Union[KeyboardKey, KeyboardKeyCode], ...]:
     """
-    Parses string into list of keys that can have events in pynput.
+    Parses string into keys that can have events in pynput.
+
+    Results are cached, so they are returned as (immutable) tuples.
 
     Args:
         string: the string form of the key. Single char or special name
 
     Returns:
-        List of Key/KeyCode objects representing keys on the keyboard
+        tuple of Key/KeyCode objects representing keys on the keyboard
     """
     string_forms: List[str] = list(map(str.lower, string.split(",")))
     final: List[Union[KeyboardKey, KeyboardKeyCode]] = []
@@ -54,9 +67,10 @@ def _key_config_parser(string: str) -> List[Union[KeyboardKey, KeyboardKeyCode]]
                 "Keys must be alpha-numeric, either single characters "
                 'on the keyboard or special names like "enter".'
             )
-    return final
+    return tuple(final)
 
 
+@lru_cache(maxsize=64)
 def _string_form_of_key(key: Union[KeyboardKey, KeyboardKeyCode]) -> str:
     """
     Gets the string form of the given key/keycode.
@@ -70,12 +84,14 @@ def _string_form_of_key(key: Union[KeyboardKey, KeyboardKeyCode]) -> str:
     return key.name if isinstance(key, KeyboardKey) else key.char
 
 
-def _key_config_stringifier(keys: List[Union[KeyboardKey, KeyboardKeyCode]]) -> str:
+def _key_config_stringifier(
+    keys: Sequence[Union[KeyboardKey, KeyboardKeyCode]]
+) -> str:
     """
     Creates a single string form of a key list for printing to console in useful way.
 
     Args:
-        keys: list of Key/KeyCode objects that are in the config variable value
+        keys: sequence of Key/KeyCode objects that are in the config variable value
 
     Returns:
         comma-separated list like the one that could be provided to _key_config_parser
@@ -119,6 +135,11 @@ class _GlobalConfig:
     def __init__(self):
         """Creates the global config singleton."""
         self.values: Dict[str, Any] = {}
+        self._stringified: Dict[str, str] = {}
+        self._dirty: bool = False
+        self._version: int = 0
+        self._validated_version: int = -1
+        atexit.register(self._flush_at_exit)
         if os.path.exists(GLOBAL_CONFIG_FILENAME):
             self.load()
         else:
@@ -148,8 +169,20 @@ class _GlobalConfig:
 
     def _validate_keyboard_config(self) -> None:
         """Ensures that no keys are bound to multiple functions."""
+        config_keys: List[str] = [
+            f"{e}_keys" for e in ["skip", "abort", "continue", "undo"]
+        ]
+        seen: Set[str] = set()
+        for key in (key for name in config_keys for key in self.values[name]):
+            string_form: str = _string_form_of_key(key)
+            if string_form in seen:
+                break
+            seen.add(string_form)
+        else:
+            return
+        # only build the full description of the conflicts once one has been found
         bound: DefaultDict[str, List[str]] = defaultdict(list)
-        for config_key in [f"{e}_keys" for e in ["skip", "abort", "continue", "undo"]]:
+        for config_key in config_keys:
             for key in self.values[config_key]:
                 bound[_string_form_of_key(key)].append(config_key)
         for valid in {key for (key, value) in bound.items() if len(value) == 1}:
@@ -162,15 +195,20 @@ class _GlobalConfig:
         return
 
     def validate(self) -> None:
-        """Performs validation of config to ensure that config has not broken."""
+        """
+        Performs validation of config to ensure that config has not broken.
+
+        Validation is skipped if no variable has been set since the last success.
+        """
+        if self._validated_version == self._version:
+            return
         self._validate_config_variables()
         self._validate_keyboard_config()
+        self._validated_version = self._version
         return
 
-    def save(self) -> None:
-        """
-        Saves the config to the yaml file.
-        """
+    def _validate_for_save(self) -> None:
+        """Validates the config, raising an error explaining why it can't be saved."""
         try:
             self.validate()
         except ValueError as exception:
@@ -178,12 +216,34 @@ class _GlobalConfig:
                 "Couldn't save config because validation failed "
                 f"with the following exception: {exception}"
             )
-        config: Dict[str, str] = {
-            key: DEFAULT_GLOBAL_CONFIG[key].stringifier(value)
-            for (key, value) in self.values.items()
-        }
+        return
+
+    def save(self) -> None:
+        """
+        Saves the config to the yaml file.
+        """
+        self._validate_for_save()
         with open(GLOBAL_CONFIG_FILENAME, "w") as file:
-            yaml.dump(config, file)
+            yaml.dump(self._stringified, file, Dumper=YAML_DUMPER)
+        self._dirty = False
+        return
+
+    def flush(self) -> None:
+        """
+        Saves the config to the yaml file if it has unsaved changes.
+        """
+        if self._dirty:
+            self.save()
+        return
+
+    def _flush_at_exit(self) -> None:
+        """
+        Flushes the config at interpreter exit, logging (not raising) any failure.
+        """
+        try:
+            self.flush()
+        except Exception as exception:
+            logger.error(f"Couldn't save global config at exit: {exception}")
         return
 
     def load(self) -> None:
@@ -191,7 +251,7 @@ class _GlobalConfig:
         Loads the config from the yaml file.
         """
         with open(GLOBAL_CONFIG_FILENAME, "r") as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=YAML_LOADER)
         assert isinstance(config, dict)
         for (key, value) in config.items():
             self._set(key, value)
@@ -219,6 +279,8 @@ class _GlobalConfig:
         """
         formatted: Any = DEFAULT_GLOBAL_CONFIG[key].parser(value)
         self.values[key] = formatted
+        self._stringified[key] = DEFAULT_GLOBAL_CONFIG[key].stringifier(formatted)
+        self._version += 1
         logging.info(
             f"Setting global config variable {key} to {formatted}. "
             f"The string passed was {value}."
@@ -229,12 +291,36 @@ class _GlobalConfig:
         """
         Sets a config value associated with the given key.
 
+        The config is validated immediately (and the change is undone if invalid), but
+        only written to disk on flush (which happens automatically at exit).
+
         Args:
             key: the config variable to change
             value: the string form of the value to set for the given key
         """
+        had_key: bool = key in self.values
+        previous: Tuple[Any, Any, int] = (
+            self.values.get(key),
+            self._stringified.get(key),
+            self._version,
+        )
         self._set(key, value)
-        self.save()
+        try:
+            self.validate()
+        except ValueError as exception:
+            # roll back so that the last valid config is what gets saved
+            if had_key:
+                (self.values[key], self._stringified[key], self._version) = previous
+            else:
+                self.values.pop(key)
+                self._stringified.pop(key)
+                self._version = previous[2]
+            raise ValueError(
+                f"Couldn't set config variable {key} to {value}, so it was left "
+                "unchanged. Validation failed with the following exception: "
+                f"{exception}"
+            )
+        self._dirty = True
         return
 
     def __contains__(self, key: str) -> bool:
@@ -276,12 +362,13 @@ class _GlobalConfig:
             print_func: the function to use for printing
         """
         if name is None:
-            for name in self:
-                print_func(
-                    f"{name}: {DEFAULT_GLOBAL_CONFIG[name].stringifier(self[name])}"
+            print_func(
+                "\n".join(
+                    f"{name}: {string}" for (name, string) in self._stringified.items()
                 )
+            )
         elif name in self:
-            print_func(f"{name}: {DEFAULT_GLOBAL_CONFIG[name].stringifier(self[name])}")
+            print_func(f"{name}: {self._stringified[name]}")
         else:
             print_func(f"{name} not in cubetime config.")
         return
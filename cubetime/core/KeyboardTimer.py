@@ -1,18 +1,29 @@
-import click
 import logging
 from pynput.keyboard import Controller as KeyboardController
 from pynput.keyboard import Events as KeyboardEvents
 from pynput.keyboard import Key as KeyboardKey
+from pynput.keyboard import KeyCode as KeyboardKeyCode
 import signal
-from typing import Optional
+import sys
+from typing import FrozenSet, Optional, Union
 
 from cubetime.core.Config import global_config
 from cubetime.core.Timer import Timer
 
+has_termios: bool
+try:
+    import termios
+except ImportError:
+    has_termios = False
+else:
+    has_termios = True
+
 logger = logging.getLogger(__name__)
 
 SWALLOW_TIMEOUT: int = 1
 
+KeySet = FrozenSet[Union[KeyboardKey, KeyboardKeyCode]]
+
 
 class KeyboardTimer(Timer):
     """An interactive multi-segment timer."""
@@ -34,31 +45,47 @@ class KeyboardTimer(Timer):
             False if it should be broken,
             None if this event did nothing
         """
-        segment_index: int = len(self.unix_times) - 1
-
-        def log_dispatch(func: str) -> None:
-            logger.debug(f"Dispatching to {func} because {event.key} was pressed.")
-            return
-
-        if event.key in global_config["undo_keys"]:
-            log_dispatch("undo")
+        segment_index: int = len(self.clock_times) - 1
+        if event.key in self._undo_keys:
+            self._log_dispatch("undo", event)
             return self._undo(segment_index)
-        elif event.key in global_config["continue_keys"]:
-            log_dispatch("continue")
+        elif event.key in self._continue_keys:
+            self._log_dispatch("continue", event)
             self._add_new_segment(segment_index, skipped=False)
             return True
-        elif event.key in global_config["skip_keys"]:
-            log_dispatch("skip")
+        elif event.key in self._skip_keys:
+            self._log_dispatch("skip", event)
             self._add_new_segment(segment_index, skipped=True)
             return True
-        elif event.key in global_config["abort_keys"]:
-            log_dispatch("abort")
+        elif event.key in self._abort_keys:
+            self._log_dispatch("abort", event)
             return False
         return None
 
+    @staticmethod
+    def _log_dispatch(func: str, event: KeyboardEvents.Press) -> None:
+        """
+        Logs which action a keystroke is being dispatched to (only if debugging).
+
+        Args:
+            func: name of the action being dispatched to
+            event: the event detected by the keyboard listener from pynput
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Dispatching to {func} because {event.key} was pressed.")
+        return
+
     @staticmethod
     def _swallow_all_queued_keystrokes() -> None:
-        """Swallows keystrokes from run by calling input() repeatedly for one second."""
+        """
+        Swallows keystrokes from run so that they don't show up after timing.
+
+        On terminals supporting termios, the pending input is discarded immediately.
+        Otherwise, input() is called repeatedly for one second.
+        """
+        if has_termios and sys.stdin.isatty():
+            termios.tcflush(sys.stdin.fileno(), termios.TCIFLUSH)
+            return
         signal.signal(signal.SIGALRM, lambda *args: exec("raise StopIteration"))
         controller: KeyboardController = KeyboardController()
         controller.press(KeyboardKey.enter)
@@ -78,15 +105,21 @@ class KeyboardTimer(Timer):
         Returns:
             times for each of the segments, None if run shouldn't be added
         """
-        click.prompt(
-            f"Press enter to start {self.segments[0]}", default="", show_default=False
-        )
+        # snapshot key bindings into sets so each keystroke is a few hash lookups
+        self._undo_keys: KeySet = frozenset(global_config["undo_keys"])
+        self._continue_keys: KeySet = frozenset(global_config["continue_keys"])
+        self._skip_keys: KeySet = frozenset(global_config["skip_keys"])
+        self._abort_keys: KeySet = frozenset(global_config["abort_keys"])
+        input(f"Press enter to start {self.segments[0]}: ")
         self.restart()
         self._print_next_segment_info()
+        # bound once so that each event only does local lookups before dispatching
+        time_loop_iteration = self._time_loop_iteration
+        press_type: type = KeyboardEvents.Press
         with KeyboardEvents() as events:
             for event in events:
-                if isinstance(event, KeyboardEvents.Press):
-                    iteration_result: Optional[bool] = self._time_loop_iteration(event)
+                if isinstance(event, press_type):
+                    iteration_result: Optional[bool] = time_loop_iteration(event)
                     if iteration_result is None:
                         continue
                     elif not (iteration_result and self._print_next_segment_info()):
@@ -14,6 +14,13 @@ except ImportError:
     has_pyaudio = False
 else:
     has_pyaudio = True
+has_numba: bool
+try:
+    from numba import njit
+except ImportError:
+    has_numba = False
+else:
+    has_numba = True
 
 from cubetime.core.Timer import Timer
 
@@ -22,6 +29,32 @@ logger = logging.getLogger(__name__)
 SAMPLING_RATE_HZ: int = 44100
 NUM_SAMPLES_PER_CHUNK: int = 50
 # using 50 samples per chunk means audio is processed about every millisecond
+PRESS_THRESHOLD: np.int16 = np.int16(-16500)
+# the pedal is considered pressed if any audio sample in a chunk is below this
+
+
+def _pedal_pressed(array: np.ndarray) -> bool:
+    """
+    Checks whether a chunk of audio from the pedal microphone contains a press.
+
+    Args:
+        array: 1D numpy array of the 16 bit ints of audio data
+
+    Returns:
+        True if any sample is below PRESS_THRESHOLD
+    """
+    if has_numba:
+        for sample in array:
+            if sample < PRESS_THRESHOLD:
+                return True
+        return False
+    else:
+        return np.less(array, PRESS_THRESHOLD).any()
+
+
+if has_numba:
+    # compiling the scan keeps the audio callback well inside its ~1ms budget
+    _pedal_pressed = njit(cache=True, nogil=True)(_pedal_pressed)
 
 
 @contextmanager
@@ -51,9 +84,11 @@ class RockBandPedalTimer(Timer):
             )
         self._started: bool = False
         self._extreme_on_previous: bool = False
+        # call once so any compilation happens before the audio stream starts
+        _pedal_pressed(np.zeros(NUM_SAMPLES_PER_CHUNK, dtype=np.int16))
 
     def restart(self) -> None:
-        """Restarts the timer: sets unix times to [now] and sets the _started flag."""
+        """Restarts the timer: sets clock times to [now] and sets the _started flag."""
         super().restart()
         self._started = True
         return
@@ -65,22 +100,28 @@ class RockBandPedalTimer(Timer):
         Returns:
             True if all segments have been completed, False otherwise
         """
-        log_message: str = f"Received pedal press at {datetime.now()}."
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
         if self._started:
-            segment_index: int = len(self.unix_times) - 1
-            segment: str = self.segments[segment_index]
-            logger.debug(f"{log_message} Marking {segment} as complete.")
+            segment_index: int = len(self.clock_times) - 1
+            if debug:
+                logger.debug(
+                    f"Received pedal press at {datetime.now()}. "
+                    f"Marking {self.segments[segment_index]} as complete."
+                )
             self._add_new_segment(segment_index, skipped=False)
             return not self._print_next_segment_info()
         else:
-            logger.debug(f"{log_message} Starting timer.")
+            if debug:
+                logger.debug(
+                    f"Received pedal press at {datetime.now()}. Starting timer."
+                )
             self.restart()
             self._print_next_segment_info()
             return False
 
     def _process_audio(
         self, data: bytes, frame_count: int, time_info: Dict[str, float], status: int
-    ) -> Tuple[np.ndarray, int]:
+    ) -> Tuple[bytes, int]:
         """
         Processes a batch of audio data from the pedal microphone.
 
@@ -91,20 +132,19 @@ class RockBandPedalTimer(Timer):
             status: audio stream status
 
         Returns:
-            (array, flag):
-                array: numpy array of the 16 bit ints of data
+            (data, flag):
+                data: the audio data passed in (ignored since stream is input only)
                 flag: pyaudio.paComplete if done, pyaudio.paContinue otherwise
         """
-        array: np.ndarray = np.frombuffer(data, dtype=np.int16)
         flag: int = pyaudio.paContinue
-        if (np.min(array) < -16500):
+        if _pedal_pressed(np.frombuffer(data, dtype=np.int16)):
             if not self._extreme_on_previous:
                 if self._on_press():
                     flag = pyaudio.paComplete
                 self._extreme_on_previous = True
         else:
             self._extreme_on_previous = False
-        return (array, flag)
+        return (data, flag)
     
     def _time(self) -> None:
         """Times a run using a microphone-like rock band drum pedal"""
@@ -1,20 +1,82 @@
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
 import os
-from typing import Callable, Collection, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
 import pandas as pd
 
 from cubetime.core.Config import global_config
 from cubetime.core.Formatting import print_pandas_dataframe
-from cubetime.core.TimedTask import TimedTask
-from cubetime.core.TimeSet import TimeSet, TIME_AGG_FUNCS
+from cubetime.core.TimedTask import CONFIG_FILE_NAME, TimedTask
+from cubetime.core.TimeSet import AGG_FUNCS, TIME_AGG_FUNCS
 
 logger = logging.getLogger(__name__)
 
 SPECIAL_CHARACTERS: List[str] = [","]
 """Characters that are not allowed in segment or task names."""
 
+SPECIAL_CHARACTER_SET: FrozenSet[str] = frozenset(SPECIAL_CHARACTERS)
+"""Set form of SPECIAL_CHARACTERS for checking names in a single pass."""
+
+MIN_TASKS_FOR_PARALLEL_LOAD: int = 8
+"""Number of tasks below which configs are read serially (avoids pool startup)."""
+
+MAX_LOAD_WORKERS: int = 32
+"""Maximum number of threads used to read task configs."""
+
+TASK_CACHE_FILE_NAME: str = ".taskindex.cache"
+"""Name of the file (inside the data directory) caching the configs of all tasks."""
+
+
+class TimeSpentRow(NamedTuple):
+    """Class storing the amount of time spent on a single task (or on all tasks)."""
+
+    name: str
+    """name of the task (or "total")"""
+    count: int
+    """number of runs of the task"""
+    time_spent: float
+    """total time spent on the task in seconds"""
+
+
+class _LeafDirectoryTable(Dict[int, str]):
+    """
+    Translation table (for str.translate) that maps characters that are not valid in
+    leaf directories to underscores. Entries are filled in the first time they're used.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        """
+        Finds (and stores) the translation of a character not yet in the table.
+
+        Args:
+            code_point: the ordinal of the character to translate
+
+        Returns:
+            the character itself if it is valid in leaf directories, "_" otherwise
+        """
+        character: str = chr(code_point)
+        translation: str = character if TaskIndex.is_valid_char(character) else "_"
+        self[code_point] = translation
+        return translation
+
+
+LEAF_DIRECTORY_TABLE: _LeafDirectoryTable = _LeafDirectoryTable()
+"""Table used to translate task names into default leaf directory names."""
+
 
 class TaskIndex:
     """
@@ -30,42 +92,162 @@ class TaskIndex:
             if data_directory is None
             else data_directory
         )
-        os.makedirs(self.data_directory, exist_ok=True)
         self._timed_tasks: Optional[Dict[str, TimedTask]] = None
         self._alias_dictionary: Optional[Dict[str, str]] = None
+        self._task_names: Optional[List[str]] = None
+
+    def _ensure_data_directory(self) -> None:
+        """Creates the data directory if it doesn't exist yet."""
+        os.makedirs(self.data_directory, exist_ok=True)
+        return
 
     @staticmethod
-    def _load_tasks(directory: str) -> List[TimedTask]:
+    def _find_task_directories(directory: str) -> Tuple[List[str], Dict[str, int]]:
         """
-        Loads tasks from the given directory, recursively.
+        Finds the directories of all tasks stored in the given directory.
 
         Args:
             directory: the directory to search for tasks
 
         Returns:
-            list of tasks loaded from this directory (and all directories inside it)
-        """
-        tasks: List[TimedTask] = []
-        for element in os.scandir(directory):
-            if element.is_dir():
-                try:
-                    tasks.append(TimedTask.from_directory(element.path))
-                except FileNotFoundError:
-                    tasks.extend(TaskIndex._load_tasks(element.path))
+            (task_directories, searched):
+                task_directories: directories (inside directory) containing task configs
+                searched: modification times (ns) of the directories searched for tasks
+        """
+        task_directories: List[str] = []
+        searched: Dict[str, int] = {}
+        for (root, subdirectories, files) in os.walk(directory):
+            # the data directory itself is never a task directory
+            if (root != directory) and (CONFIG_FILE_NAME in files):
+                task_directories.append(root)
+                # task directories aren't searched for more tasks
+                subdirectories.clear()
+            else:
+                searched[root] = os.stat(root).st_mtime_ns
+        return (task_directories, searched)
+
+    @staticmethod
+    def _load_tasks(task_directories: List[str]) -> List[TimedTask]:
+        """
+        Loads tasks from their directories.
+
+        Args:
+            task_directories: the directories containing task configs
+
+        Returns:
+            list of tasks loaded from the given directories
+        """
+        if len(task_directories) < MIN_TASKS_FOR_PARALLEL_LOAD:
+            return [TimedTask.from_directory(path) for path in task_directories]
+        max_workers: int = min(MAX_LOAD_WORKERS, 4 * (os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(TimedTask.from_directory, task_directories))
+
+    @property
+    def task_cache_file_name(self) -> str:
+        """
+        The file in which the configs of all tasks are cached.
+
+        Returns:
+            path to the cache file inside the data directory
+        """
+        return os.path.join(self.data_directory, TASK_CACHE_FILE_NAME)
+
+    def _read_task_cache(self) -> Optional[List[TimedTask]]:
+        """
+        Loads tasks from the cache file if nothing has changed since it was written.
+
+        A change is detected if any searched directory or any task config has been
+        modified (or resized), or if the cached names/aliases are not unique. Times
+        that aren't older than the cache itself can't be trusted to detect changes
+        (they may share a clock tick with a later edit), so they also force a rescan.
+
+        Returns:
+            list of cached tasks, or None if the cache is missing or out of date
+        """
+        try:
+            written: int = os.stat(self.task_cache_file_name).st_mtime_ns
+            with open(self.task_cache_file_name, "r") as file:
+                cache: Dict[str, Any] = json.load(file)
+            for (directory, modified) in cache["searched"].items():
+                if (modified >= written) or (
+                    os.stat(directory).st_mtime_ns != modified
+                ):
+                    return None
+            tasks: List[TimedTask] = []
+            for (directory, (modified, size, config)) in cache["tasks"].items():
+                task: TimedTask = TimedTask.from_config(directory, config)
+                status: os.stat_result = os.stat(task.config_filename)
+                if (
+                    (modified >= written)
+                    or (status.st_mtime_ns != modified)
+                    or (status.st_size != size)
+                ):
+                    return None
+                tasks.append(task)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        names: List[str] = [
+            name for task in tasks for name in [task.name, *task.aliases]
+        ]
+        if len(set(names)) != len(names):
+            return None
         return tasks
 
+    def _write_task_cache(
+        self, tasks: List[TimedTask], searched: Dict[str, int]
+    ) -> None:
+        """
+        Writes the configs of the given tasks to the cache file.
+
+        Failures are logged and otherwise ignored since the cache is an optimization.
+
+        Args:
+            tasks: all of the tasks stored in the data directory
+            searched: modification times (ns) of the directories searched for tasks
+        """
+        try:
+            if not os.path.exists(self.task_cache_file_name):
+                # creating the cache file modifies the data directory, so it is created
+                # before the data directory's modification time is recorded
+                open(self.task_cache_file_name, "w").close()
+                searched[self.data_directory] = os.stat(
+                    self.data_directory
+                ).st_mtime_ns
+            configs: Dict[str, List[Any]] = {}
+            for task in tasks:
+                status: os.stat_result = os.stat(task.config_filename)
+                configs[task.directory] = [
+                    status.st_mtime_ns,
+                    status.st_size,
+                    task.config,
+                ]
+            with open(self.task_cache_file_name, "w") as file:
+                # aliases are stored as a set, which JSON stores as a (sorted) list
+                json.dump(
+                    {"searched": searched, "tasks": configs}, file, default=sorted
+                )
+        except OSError as exception:
+            logger.debug(f"Couldn't write task cache: {exception}")
+        return
+
     @property
     def timed_tasks(self) -> Dict[str, TimedTask]:
         """
-        Loads all timed tasks from their configs.
+        Loads all timed tasks from their configs (or from the cache of them).
 
         Returns:
             dictionary from timed task name to the task itself
         """
         if self._timed_tasks is None:
-            self._timed_tasks = {
-                task.name: task for task in self._load_tasks(self.data_directory)
-            }
+            tasks: Optional[List[TimedTask]] = self._read_task_cache()
+            if tasks is None:
+                (task_directories, searched) = self._find_task_directories(
+                    self.data_directory
+                )
+                tasks = self._load_tasks(task_directories)
+                self._write_task_cache(tasks, searched)
+            self._timed_tasks = {task.name: task for task in tasks}
             logger.debug(f"Loaded {len(self._timed_tasks)} stored tasks.")
         return self._timed_tasks
 
@@ -77,7 +259,9 @@ class TaskIndex:
         Returns:
             list of task names sorted alphabetically
         """
-        return sorted(self.timed_tasks)
+        if self._task_names is None:
+            self._task_names = sorted(self.timed_tasks)
+        return self._task_names
 
     @property
     def alias_dictionary(self) -> Dict[str, str]:
@@ -105,6 +289,9 @@ class TaskIndex:
         Returns:
             TimedTask object storing given task
         """
+        timed_task: Optional[TimedTask] = self.timed_tasks.get(key)
+        if timed_task is not None:
+            return timed_task
         try:
             return self.timed_tasks[self.alias_dictionary[key]]
         except KeyError:
@@ -121,7 +308,7 @@ class TaskIndex:
             names: task and/or segment name(s) to check
         """
         for name in names:
-            if any(character in name for character in SPECIAL_CHARACTERS):
+            if not SPECIAL_CHARACTER_SET.isdisjoint(name):
                 raise ValueError(
                     "The following characters are not allowed in "
                     f"task or segment names, {SPECIAL_CHARACTERS}."
@@ -164,21 +351,29 @@ class TaskIndex:
         if name in self.alias_dictionary:
             raise ValueError("Cannot add two timed tasks with the same name.")
         self.check_names(name, *segments)
+        self._ensure_data_directory()
         if leaf_directory is None:
-            leaf_directory = "".join(c if self.is_valid_char(c) else "_" for c in name)
+            leaf_directory = name.translate(LEAF_DIRECTORY_TABLE)
         directory = os.path.join(self.data_directory, leaf_directory)
         try:
-            os.makedirs(directory, exist_ok=False)
+            # parent is usually the data directory (which exists), so try that first
+            try:
+                os.mkdir(directory)
+            except FileNotFoundError:
+                os.makedirs(directory, exist_ok=False)
         except FileExistsError:
             raise FileExistsError(
                 f"{leaf_directory} already exists within {self.data_directory}, and "
                 f'creating new task "{name}" with that directory, would overwrite it.'
             )
-        self.alias_dictionary[name] = name
+        if self._alias_dictionary is not None:
+            self._alias_dictionary[name] = name
         new_task: TimedTask = TimedTask(
             name=name, directory=directory, segments=segments, min_best=min_best
         )
         self.timed_tasks[name] = new_task
+        if self._task_names is not None:
+            bisect.insort(self._task_names, name)
         new_task.save()
         if aliases is not None:
             self.add_aliases(name, aliases)
@@ -198,13 +393,17 @@ class TaskIndex:
             print_func: function to use for printing
         """
         task_names: List[str] = self.task_names if tasknames is None else tasknames
-        summary: pd.DataFrame = pd.DataFrame()
+        records: List[Dict[str, Any]] = []
+        index: List[str] = []
         for key in task_names:
             task: TimedTask = self[key]
-            time_set: TimeSet = task.time_set
-            summary[task.name] = time_set.cumulative_summary.loc[time_set.segments[-1]]
-        summary = summary.T
-        summary["count"] = summary["count"].astype(int)
+            record: Dict[str, Any] = task.time_set.final_cumulative_summary.to_dict()
+            record["count"] = int(record["count"])
+            records.append(record)
+            index.append(task.name)
+        summary: pd.DataFrame = pd.DataFrame.from_records(
+            records, index=index, columns=AGG_FUNCS
+        )
         print_func()
         print_pandas_dataframe(
             summary, time_columns=TIME_AGG_FUNCS, print_func=print_func
@@ -256,12 +455,22 @@ class TaskIndex:
             key: name or existing alias of task to add aliases to
             aliases: string aliases to add
         """
-        failed_aliases: Dict[str, str] = {}
-        for alias in aliases:
-            try:
-                self.add_alias(key, alias)
-            except ValueError:
-                failed_aliases[alias] = self.alias_dictionary[alias]
+        timed_task: TimedTask = self[key]
+        failed_aliases: Dict[str, str] = {
+            alias: self.alias_dictionary[alias]
+            for alias in aliases
+            if alias in self.alias_dictionary
+        }
+        new_aliases: List[str] = [
+            alias for alias in aliases if alias not in failed_aliases
+        ]
+        if new_aliases:
+            self.check_names(*new_aliases)
+            # the config of the task is only saved once for all of the new aliases
+            timed_task.add_aliases(new_aliases)
+            for alias in new_aliases:
+                self.alias_dictionary[alias] = timed_task.name
+            logger.info(f"Added aliases {new_aliases}->{timed_task.name}.")
         if failed_aliases:
             failed_alias_strings = [
                 f'"{alias}"->"{name}"' for (alias, name) in failed_aliases.items()
@@ -328,37 +537,67 @@ class TaskIndex:
             raise ValueError(
                 f"Cannot delete a task by alias. Use the full name ({timed_task.name})."
             )
-        self.alias_dictionary.pop(timed_task.name)
-        for alias in timed_task.aliases:
-            self.alias_dictionary.pop(alias)
+        # the alias dictionary doesn't need to be built just to remove from it
+        if self._alias_dictionary is not None:
+            self._alias_dictionary.pop(timed_task.name)
+            for alias in timed_task.aliases:
+                self._alias_dictionary.pop(alias)
         timed_task.delete()
         self.timed_tasks.pop(name)
+        if self._task_names is not None:
+            self._task_names.remove(name)
         logger.info(f"Deleted task with name {name}.")
         return
 
-    def time_spent(self, names: List[str] = None) -> pd.DataFrame:
+    def _time_spent_raw(self, names: List[str] = None) -> List[TimeSpentRow]:
         """
-        Gets the amount of time spent on some or all stored tasks.
+        Gets the amount of time spent on some or all stored tasks without pandas.
 
         Args:
             names: list of string names/aliases of tasks to include (None includes all)
 
         Returns:
-            single column data frame with rows for each task included and a total
+            list with a row for each task included followed by a total row
         """
         if names is None:
             names = self.task_names
-        frame = pd.DataFrame(data=np.ndarray((2, 0)), index=["count", "time spent"])
+        rows: List[TimeSpentRow] = []
         for name in names:
             timed_task: TimedTask = self[name]
-            frame[timed_task.name] = [
-                len(timed_task.time_set),
-                timed_task.total_time_spent,
-            ]
-        frame["total"] = frame.sum(axis=1)
-        frame = frame.T
-        frame["count"] = frame["count"].astype(int)
-        return frame
+            rows.append(
+                TimeSpentRow(
+                    timed_task.name,
+                    len(timed_task.time_set),
+                    float(timed_task.total_time_spent),
+                )
+            )
+        rows.append(
+            TimeSpentRow(
+                "total",
+                sum(row.count for row in rows),
+                float(np.nansum([row.time_spent for row in rows])),
+            )
+        )
+        return rows
+
+    def time_spent(self, names: List[str] = None) -> pd.DataFrame:
+        """
+        Gets the amount of time spent on some or all stored tasks.
+
+        Args:
+            names: list of string names/aliases of tasks to include (None includes all)
+
+        Returns:
+            single column data frame with rows for each task included and a total
+        """
+        rows: List[TimeSpentRow] = self._time_spent_raw(names)
+        return pd.DataFrame(
+            {
+                "count": [row.count for row in rows],
+                "time spent": [row.time_spent for row in rows],
+            },
+            index=[row.name for row in rows],
+        )
 
     def print_time_spent(
         self, names: List[str] = None, print_func: Callable[..., None] = print
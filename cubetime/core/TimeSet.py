@@ -1,7 +1,8 @@
 from datetime import datetime
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 from typing_extensions import Self
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -22,6 +23,77 @@ AGG_FUNCS: List[str] = ["min", "median", "max", "mean", "std", "sum", "count"]
 """Aggregation functions to use for summarizing times."""
 TIME_AGG_FUNCS: List[str] = [f for f in AGG_FUNCS if f not in ["count"]]
 """Subset of aggregation functions that create times (columns that should be H:MM:SS)"""
+MIN_BUFFER_CAPACITY: int = 16
+"""Minimum number of runs that the buffers backing a TimeSet are allocated to hold."""
+PARQUET_ENGINE: str = "fastparquet"
+"""Parquet library used to save and load TimeSets (given so pandas doesn't search)."""
+
+
+def aggregate_times(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes AGG_FUNCS on each column of times using NumPy reductions.
+
+    Gives the same result as frame.agg(AGG_FUNCS) (NaNs are skipped), but without
+    dispatching each aggregation through pandas separately.
+
+    Args:
+        frame: DataFrame whose columns all contain times
+
+    Returns:
+        DataFrame with agg functions as rows and the columns of frame as columns
+    """
+    values: np.ndarray = frame.to_numpy(dtype=np.float64)
+    count: np.ndarray = np.count_nonzero(~np.isnan(values), axis=0)
+    total: np.ndarray = np.nansum(values, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean: np.ndarray = total / count
+        squared_deviations: np.ndarray = np.nansum((values - mean) ** 2, axis=0)
+        std: np.ndarray = np.where(
+            count > 1, np.sqrt(squared_deviations / (count - 1)), np.nan
+        )
+    if len(values) == 0:
+        (minimum, median, maximum) = 3 * [np.full(values.shape[1], np.nan)]
+    else:
+        # one sort gives min, median, and max (nans are sorted to the end, and
+        # columns with no times give nan because their first element is nan)
+        ordered: np.ndarray = np.sort(values, axis=0)
+        columns: np.ndarray = np.arange(values.shape[1])
+        low_middle: np.ndarray = np.maximum((count - 1) // 2, 0)
+        high_middle: np.ndarray = np.maximum(count // 2, low_middle)
+        minimum = ordered[0]
+        median = (ordered[low_middle, columns] + ordered[high_middle, columns]) / 2
+        maximum = ordered[np.maximum(count - 1, 0), columns]
+    return pd.DataFrame(
+        data=[minimum, median, maximum, mean, std, total, count],
+        index=AGG_FUNCS,
+        columns=frame.columns,
+    )
+
+
+def cumulative_to_standalone(
+    cumulative_times: np.ndarray, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Converts cumulative times to standalone times along the last axis.
+
+    Equivalent to np.diff(cumulative_times, axis=-1, prepend=0), but without
+    concatenating the zeros onto a temporary copy first.
+
+    Args:
+        cumulative_times: array whose last axis contains times at end of each segment
+        out: array to store the result in (a new array is made if None)
+
+    Returns:
+        array of the same shape containing the durations of each segment
+    """
+    cumulative_times = np.asarray(cumulative_times, dtype=np.float64)
+    if out is None:
+        # keep the memory layout (e.g. column-major buffers) instead of forcing C order
+        out = cumulative_times.copy(order="K")
+    else:
+        out[...] = cumulative_times
+    out[..., 1:] -= cumulative_times[..., :-1]
+    return out
 
 
 class TimeSet:
@@ -30,22 +102,42 @@ class TimeSet:
     """
 
     def __init__(
-        self, cumulative_times: pd.DataFrame, copy: bool = False, min_best: bool = True
+        self,
+        cumulative_times: pd.DataFrame,
+        copy: bool = False,
+        min_best: bool = True,
+        _segments: Optional[List[str]] = None,
     ):
         """
         Initializes a new TimeSet with a DataFrame
 
         Args:
             cumulative_times: DataFrame containing cumulative times and dates of runs
-            copy: if True, times is copied before being stored
+            copy: if True, times is copied before being stored (otherwise it
+                must not be edited after being given to the TimeSet)
             min_best: if True, smaller times are considered better
+            _segments: segments of cumulative_times if already validated (internal)
         """
-        self._cumulative_times: pd.DataFrame = (
+        self._cumulative_times: Optional[pd.DataFrame] = (
             cumulative_times.copy() if copy else cumulative_times
         )
         self._times: Optional[pd.DataFrame] = None
-        self.segments: List[str] = self._process_columns_into_segments()
+        self.segments: List[str] = (
+            self._process_columns_into_segments() if _segments is None else _segments
+        )
         self.min_best: bool = min_best
+        self._date_column_index: int = list(cumulative_times.columns).index(
+            DATE_COLUMN
+        )
+        # buffers are created on the first call to add_row. After that they store the
+        # runs, and _cumulative_times is a view of their first _size rows
+        self._dates_buffer: Optional[np.ndarray] = None
+        self._cumulative_buffer: Optional[np.ndarray] = None
+        self._times_buffer: Optional[np.ndarray] = None
+        self._size: int = 0
+        # derived values are cached along with the _version they were computed at
+        self._version: int = 0
+        self._cache: Dict[str, Tuple[int, Any]] = {}
 
     def __eq__(self, other: Self) -> bool:
         """
@@ -61,17 +153,14 @@ class TimeSet:
             return False
         if self.segments != other.segments:
             return False
-        if self.cumulative_times.shape != other.cumulative_times.shape:
-            return False
-        if list(self.dates) != list(other.dates):
+        if self._cumulative_frame.shape != other._cumulative_frame.shape:
             return False
-        these_times = self.cumulative_times[self.segments].values.astype(float)
-        other_times = other.cumulative_times[self.segments].values.astype(float)
-        where_nan = np.isnan(these_times)
-        if np.any(where_nan != np.isnan(other_times)):
+        if not np.array_equal(self.dates, other.dates):
             return False
-        return np.all(
-            np.where(where_nan, 0, these_times) == np.where(where_nan, 0, other_times)
+        return np.array_equal(
+            self.cumulative_values,
+            other.cumulative_values,
+            equal_nan=True,
         )
 
     @property
@@ -101,7 +190,9 @@ class TimeSet:
         Returns:
             integer number of times stored in this set
         """
-        return len(self.cumulative_times)
+        if self._cumulative_buffer is None:
+            return len(self._cumulative_times)
+        return self._size
 
     def __bool__(self) -> bool:
         """
@@ -125,7 +216,7 @@ class TimeSet:
         if segments is None:
             segments = [SINGLETON_SEGMENT_COLUMN]
         columns = [DATE_COLUMN] + segments
-        frame = pd.DataFrame(columns=columns)
+        frame = cls._with_standard_dtypes(pd.DataFrame(columns=columns))
         return cls(frame, copy=False, min_best=min_best)
 
     @classmethod
@@ -137,7 +228,12 @@ class TimeSet:
             other: the TimeSet to copy segments from
 
         """
-        return cls(other.cumulative_times[0:0], min_best=other.min_best, copy=True)
+        return cls(
+            other._cumulative_frame[0:0],
+            min_best=other.min_best,
+            copy=True,
+            _segments=list(other.segments),
+        )
 
     def copy(self) -> Self:
         """
@@ -146,7 +242,12 @@ class TimeSet:
         Returns:
             exact copy of this object
         """
-        return TimeSet(self.cumulative_times, copy=True, min_best=self.min_best)
+        return TimeSet(
+            self._cumulative_frame,
+            copy=True,
+            min_best=self.min_best,
+            _segments=list(self.segments),
+        )
 
     def save(self, filename: str) -> None:
         """
@@ -157,7 +258,7 @@ class TimeSet:
         Args:
             filename: location to save parquet file, preferably with .parquet extension
         """
-        self.cumulative_times.to_parquet(filename)
+        self._cumulative_frame.to_parquet(filename, engine=PARQUET_ENGINE)
         return
 
     @classmethod
@@ -172,7 +273,27 @@ class TimeSet:
         Returns:
             TimeSet object based on database loaded from the parquet file
         """
-        return cls(pd.read_parquet(filename), copy=False, min_best=min_best)
+        frame: pd.DataFrame = cls._with_standard_dtypes(
+            pd.read_parquet(filename, engine=PARQUET_ENGINE)
+        )
+        return cls(frame, copy=False, min_best=min_best)
+
+    @staticmethod
+    def _with_standard_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts the date column to datetime64[ns] and the segment columns to float64.
+
+        Args:
+            frame: DataFrame with a date column and segment columns
+
+        Returns:
+            DataFrame with the same columns and standard dtypes
+        """
+        dtypes: Dict[str, Any] = {
+            column: ("datetime64[ns]" if column == DATE_COLUMN else np.float64)
+            for column in frame.columns
+        }
+        return frame.astype(dtypes, copy=False)
 
     def _process_columns_into_segments(self: Self) -> List[str]:
         """
@@ -184,25 +305,18 @@ class TimeSet:
         Returns:
             list of string names of segments
         """
-        date_present: bool = False
-        segments: List[str] = []
-        for column in self.cumulative_times.columns:
-            if column == DATE_COLUMN:
-                date_present = True
-            else:
-                segments.append(column)
-        if date_present:
-            if segments:
-                return segments
-            else:
-                raise ValueError(
-                    f"No segment columns were found in cumulative_times DataFrame."
-                )
-        else:
+        columns: List[str] = list(self._cumulative_times.columns)
+        if DATE_COLUMN not in columns:
             raise ValueError(
                 f'"{DATE_COLUMN}" was expected to be a column in '
                 "cumulative_times DataFrame, but it was not found."
             )
+        segments: List[str] = [column for column in columns if column != DATE_COLUMN]
+        if not segments:
+            raise ValueError(
+                "No segment columns were found in cumulative_times DataFrame."
+            )
+        return segments
 
     @property
     def dates(self) -> np.ndarray:
@@ -212,7 +326,9 @@ class TimeSet:
         Returns:
             1D numpy.ndarray of dates when runs took place
         """
-        return self.cumulative_times[DATE_COLUMN].values
+        dates: np.ndarray = self._cumulative_frame[DATE_COLUMN].values.view()
+        dates.flags.writeable = False
+        return dates
 
     @property
     def values(self) -> np.ndarray:
@@ -223,62 +339,210 @@ class TimeSet:
             2D numpy.ndarray where the rows are different
             runs and the columns are different segments.
         """
-        return self.times[self.segments].values
+        return self._standalone_frame[self.segments].values
 
     @property
     def times(self) -> pd.DataFrame:
         """
         Gets the durations of each segment of each run.
 
+        Returns:
+            copy of the DataFrame with same columns names as cumulative_times
+            with standalone times instead of cumulative times
+        """
+        return self._standalone_frame.copy()
+
+    @property
+    def cumulative_times(self) -> pd.DataFrame:
+        """
+        Gets the times at the end of each segment of each run.
+
+        Returns:
+            copy of the DataFrame with same column names as times with
+            cumulative times instead of segment times
+        """
+        return self._cumulative_frame.copy()
+
+    @property
+    def _standalone_frame(self) -> pd.DataFrame:
+        """
+        Gets the stored standalone times without copying them.
+
+        The frame views the stored runs, so it must not be edited in place
+        (cached values derived from it wouldn't be updated).
+
         Returns:
             DataFrame with same columns names as cumulative_times
             with standalone times instead of cumulative times
         """
         if self._times is None:
-            self._times = self.cumulative_times.copy()
-            self._times[self.segments] = np.diff(
-                self._times[self.segments].values, axis=1, prepend=0
-            )
+            if self._times_buffer is None:
+                # build from the segment values directly so that nothing is copied
+                # just to be overwritten
+                frame: pd.DataFrame = self._cumulative_frame
+                self._times = pd.DataFrame(
+                    cumulative_to_standalone(frame[self.segments].to_numpy()),
+                    index=frame.index,
+                    columns=self.segments,
+                    copy=False,
+                )
+                self._times.insert(
+                    self._date_column_index, DATE_COLUMN, frame[DATE_COLUMN]
+                )
+            else:
+                self._times = self._make_frame_from_buffer(self._times_buffer)
         return self._times
 
     @property
-    def cumulative_times(self) -> pd.DataFrame:
+    def _cumulative_frame(self) -> pd.DataFrame:
         """
-        Gets the times at the end of each segment of each run.
+        Gets the stored cumulative times without copying them.
+
+        Like _standalone_frame, this must not be edited in place.
 
         Returns:
             DataFrame with same column names as times with
             cumulative times instead of segment times
         """
+        if self._cumulative_times is None:
+            self._cumulative_times = self._make_frame_from_buffer(
+                self._cumulative_buffer
+            )
         return self._cumulative_times
 
-    def _get_extreme_times(self, frame: pd.DataFrame, best: bool = True) -> pd.Series:
+    @property
+    def cumulative_values(self) -> np.ndarray:
+        """
+        Gets the cumulative times of all segments from all runs without a DataFrame.
+
+        Returns:
+            read-only 2D numpy.ndarray where the rows are different
+            runs and the columns are different segments.
+        """
+        values: np.ndarray
+        if self._cumulative_buffer is None:
+            values = self._memoize(
+                "cumulative_values",
+                lambda: self._cumulative_frame[self.segments].to_numpy(
+                    dtype=np.float64
+                ),
+            ).view()
+        else:
+            values = self._cumulative_buffer[: self._size].view()
+        values.flags.writeable = False
+        return values
+
+    @property
+    def _standalone_values(self) -> np.ndarray:
+        """
+        Gets the standalone times of all segments from all runs as a float array.
+
+        Returns:
+            2D numpy.ndarray where the rows are different
+            runs and the columns are different segments.
+        """
+        if self._times_buffer is not None:
+            return self._times_buffer[: self._size]
+        return self._memoize(
+            "standalone_values",
+            lambda: self._standalone_frame[self.segments].to_numpy(dtype=np.float64),
+        )
+
+    def _make_frame_from_buffer(self, buffer: np.ndarray) -> pd.DataFrame:
+        """
+        Makes a DataFrame that views the stored runs of a buffer of segment times.
+
+        Args:
+            buffer: either the cumulative or standalone times buffer
+
+        Returns:
+            DataFrame with date column and segment columns in the original order
+        """
+        frame: pd.DataFrame = pd.DataFrame(
+            buffer[: self._size], columns=self.segments, copy=False
+        )
+        frame.insert(
+            self._date_column_index, DATE_COLUMN, self._dates_buffer[: self._size]
+        )
+        return frame
+
+    def _memoize(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Gets a derived value, only computing it if runs were added since last time.
+
+        Args:
+            key: unique name of the derived value
+            compute: function with no arguments that computes the derived value
+
+        Returns:
+            the (possibly cached) derived value
+        """
+        cached: Optional[Tuple[int, Any]] = self._cache.get(key)
+        if (cached is not None) and (cached[0] == self._version):
+            return cached[1]
+        value: Any = compute()
+        self._cache[key] = (self._version, value)
+        return value
+
+    def _reduce_all(self, cumulative: bool) -> Dict[str, np.ndarray]:
+        """
+        Finds the minimum, maximum, and mean of each segment in a single pass.
+
+        Args:
+            cumulative: if True, cumulative times are reduced. Otherwise, standalone
+
+        Returns:
+            dictionary with "min", "max", and "mean" keys, each an array by segment
+        """
+        # with one segment, standalone and cumulative times are the same
+        cumulative = cumulative or (not self.is_multi_segment)
+        key: str = "reduced_cumulative" if cumulative else "reduced_times"
+
+        def compute() -> Dict[str, np.ndarray]:
+            values: np.ndarray = (
+                self.cumulative_values
+                if cumulative
+                else self._standalone_values
+            )
+            if len(values) == 0:
+                empty: np.ndarray = np.full(len(self.segments), np.nan)
+                return {"min": empty, "max": empty, "mean": empty}
+            with warnings.catch_warnings():
+                # all-nan columns are expected (e.g. skipped segments) and give nan
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                return {
+                    "min": np.nanmin(values, axis=0),
+                    "max": np.nanmax(values, axis=0),
+                    "mean": np.nanmean(values, axis=0),
+                }
+
+        return self._memoize(key, compute)
+
+    def _get_extreme_times(self, cumulative: bool, best: bool = True) -> pd.Series:
         """
         Aggregates all rows into the extreme times by segment
 
         Args:
-            frame: DataFrame containing times (standalone or cumulative) by segment
+            cumulative: if True, cumulative times are used. Otherwise, standalone
             best: if True, best times are yielded. if False, worst times are yielded
 
         Returns:
             Series containing the extreme times for each segment
         """
-        subframe = frame[self.segments]
-        kwargs: Dict[str, Any] = {"axis": 0, "skipna": True}
-        should_do_min: bool = self.min_best == best
-        return subframe.min(**kwargs) if should_do_min else subframe.max(**kwargs)
+        which: str = "min" if self.min_best == best else "max"
+        return pd.Series(self._reduce_all(cumulative)[which], index=self.segments)
 
-    def _get_average_times(self, frame: pd.DataFrame) -> pd.Series:
+    def _get_average_times(self, cumulative: bool) -> pd.Series:
         """
         Aggregates all rows into the average times by segment
 
         Args:
-            frame: DataFrame containing times (standalone or cumulative) by segment
+            cumulative: if True, cumulative times are used. Otherwise, standalone
 
         Returns:
             Series containing the average times for each segment
         """
-        return frame[self.segments].mean(axis=0, skipna=True)
+        return pd.Series(self._reduce_all(cumulative)["mean"], index=self.segments)
 
     @property
     def best_cumulative_times(self) -> pd.Series:
@@ -288,7 +552,10 @@ class TimeSet:
         Returns:
             Series containing best cumulative times, indexed by segment name
         """
-        return self._get_extreme_times(frame=self.cumulative_times, best=True)
+        return self._memoize(
+            "best_cumulative_times",
+            lambda: self._get_extreme_times(cumulative=True, best=True),
+        ).copy()
 
     def extreme_run_index(self, best: bool = True) -> int:
         """
@@ -300,11 +567,14 @@ class TimeSet:
         Returns:
             run index of extreme run
         """
-        final_times: np.ndarray = self.cumulative_times[self.segments[-1]].values
+        final_times: np.ndarray = self.cumulative_values[:, -1]
+        if final_times.size and np.isnan(final_times).all():
+            # nanargmin/nanargmax refuse all-nan input, but every run is equally bad
+            return 0
         if self.min_best == best:
-            return np.argmin(np.where(np.isnan(final_times), np.inf, final_times))
+            return int(np.nanargmin(final_times))
         else:
-            return np.argmax(np.where(np.isnan(final_times), -np.inf, final_times))
+            return int(np.nanargmax(final_times))
 
     @property
     def best_run_index(self) -> int:
@@ -314,7 +584,9 @@ class TimeSet:
         Returns:
             integer index of best run
         """
-        return self.extreme_run_index(best=True)
+        return self._memoize(
+            "best_run_index", lambda: self.extreme_run_index(best=True)
+        )
 
     @property
     def worst_run_index(self) -> int:
@@ -324,7 +596,9 @@ class TimeSet:
         Returns:
             integer index of worst run
         """
-        return self.extreme_run_index(best=False)
+        return self._memoize(
+            "worst_run_index", lambda: self.extreme_run_index(best=False)
+        )
 
     @property
     def average_cumulative_times(self) -> pd.Series:
@@ -334,7 +608,10 @@ class TimeSet:
         Returns:
             Series containing average cumulative times, indexed by segment name
         """
-        return self._get_average_times(frame=self.cumulative_times)
+        return self._memoize(
+            "average_cumulative_times",
+            lambda: self._get_average_times(cumulative=True),
+        ).copy()
 
     @property
     def worst_cumulative_times(self) -> pd.Series:
@@ -344,7 +621,10 @@ class TimeSet:
         Returns:
             Series containing best cumulative times, indexed by segment name
         """
-        return self._get_extreme_times(frame=self.cumulative_times, best=False)
+        return self._memoize(
+            "worst_cumulative_times",
+            lambda: self._get_extreme_times(cumulative=True, best=False),
+        ).copy()
 
     @property
     def best_times(self) -> pd.Series:
@@ -354,7 +634,9 @@ class TimeSet:
         Returns:
             Series containing best standalone times, indexed by segment name
         """
-        return self._get_extreme_times(frame=self.times, best=True)
+        return self._memoize(
+            "best_times", lambda: self._get_extreme_times(cumulative=False, best=True)
+        ).copy()
 
     @property
     def average_times(self) -> pd.Series:
@@ -364,7 +646,9 @@ class TimeSet:
         Returns:
             Series containing average standalone times, indexed by segment name
         """
-        return self._get_average_times(frame=self.times)
+        return self._memoize(
+            "average_times", lambda: self._get_average_times(cumulative=False)
+        ).copy()
 
     @property
     def worst_times(self) -> pd.Series:
@@ -374,32 +658,86 @@ class TimeSet:
         Returns:
             Series containing worst standalone times, indexed by segment name
         """
-        return self._get_extreme_times(frame=self.times, best=False)
+        return self._memoize(
+            "worst_times", lambda: self._get_extreme_times(cumulative=False, best=False)
+        ).copy()
 
-    def add_row(self, date: datetime, cumulative_times: np.ndarray) -> None:
+    def _reserve(self, num_new_runs: int) -> None:
         """
-        Adds a new row to the set.
+        Ensures that the buffers storing runs have room for more runs.
+
+        The first time this is called, the buffers are filled from cumulative_times.
+        After that, they are reallocated (with double capacity) only when full, so
+        that adding runs one at a time takes amortized constant time.
 
         Args:
-            date: the time with which the row should be associated
-            segment_times: array of (standalone) segment times
+            num_new_runs: the number of runs that will be added
         """
-        new_row: pd.DataFrame = pd.DataFrame()
-        segment_index: int = 0
-        for column in self.cumulative_times.columns:
-            if column == DATE_COLUMN:
-                new_row[DATE_COLUMN] = [date]
-            else:
-                new_row[column] = [cumulative_times[segment_index]]
-                segment_index += 1
-        if len(self) == 0:
-            self._cumulative_times = new_row
+        if self._cumulative_buffer is None:
+            frame: pd.DataFrame = self._cumulative_times
+            self._size = len(frame)
+            stored_dates: np.ndarray = pd.to_datetime(frame[DATE_COLUMN]).to_numpy(
+                dtype="datetime64[ns]"
+            )
+            stored_times: np.ndarray = frame[self.segments].to_numpy(dtype=np.float64)
+            stored_standalone: np.ndarray = cumulative_to_standalone(stored_times)
+        elif self._size + num_new_runs > len(self._cumulative_buffer):
+            stored_dates = self._dates_buffer[: self._size]
+            stored_times = self._cumulative_buffer[: self._size]
+            stored_standalone = self._times_buffer[: self._size]
         else:
-            self._cumulative_times = pd.concat(
-                [self._cumulative_times, new_row], axis=0, ignore_index=True
+            return
+        capacity: int = max(MIN_BUFFER_CAPACITY, 2 * (self._size + num_new_runs))
+        self._dates_buffer = np.empty(capacity, dtype="datetime64[ns]")
+        # column-major so each segment is contiguous, which is what the reductions
+        # over runs and pandas' column blocks both want
+        self._cumulative_buffer = np.empty((capacity, self.num_segments), order="F")
+        self._times_buffer = np.empty((capacity, self.num_segments), order="F")
+        self._dates_buffer[: self._size] = stored_dates
+        self._cumulative_buffer[: self._size] = stored_times
+        self._times_buffer[: self._size] = stored_standalone
+        return
+
+    def add_rows(self, dates: Sequence[datetime], cumulative_times: np.ndarray) -> None:
+        """
+        Adds many new rows to the set at once.
+
+        Args:
+            dates: the times with which the rows should be associated
+            cumulative_times: 2D array of cumulative segment times (one row per date)
+        """
+        new_dates: np.ndarray = pd.to_datetime(list(dates)).to_numpy(
+            dtype="datetime64[ns]"
+        )
+        new_times: np.ndarray = np.asarray(cumulative_times, dtype=np.float64)
+        if new_times.shape != (len(new_dates), self.num_segments):
+            raise ValueError(
+                f"Expected cumulative times of shape ({len(new_dates)}, "
+                f"{self.num_segments}), but got shape {new_times.shape}."
             )
-        # make sure to force recalculation of the derivative times property after this
+        self._reserve(len(new_dates))
+        new_slice: slice = slice(self._size, self._size + len(new_dates))
+        self._dates_buffer[new_slice] = new_dates
+        self._cumulative_buffer[new_slice] = new_times
+        # only the new runs' standalone times need to be computed
+        cumulative_to_standalone(new_times, out=self._times_buffer[new_slice])
+        self._size += len(new_dates)
+        self._version += 1
+        # make sure to force recalculation of the derivative properties after this
+        self._cumulative_times = None
         self._times = None
+        return
+
+    def add_row(self, date: datetime, cumulative_times: np.ndarray) -> None:
+        """
+        Adds a new row to the set.
+
+        Args:
+            date: the time with which the row should be associated
+            cumulative_times: array of cumulative segment times
+        """
+        self.add_rows([date], [cumulative_times])
+        return
 
     @staticmethod
     def _make_compare_times_from_cumulative_times(
@@ -417,7 +755,7 @@ class TimeSet:
                 cumulative_comparison: compare times for cumulative segments
         """
         return (
-            CompareTime(np.diff(cumulative_times, prepend=0)),
+            CompareTime(cumulative_to_standalone(cumulative_times)),
             CompareTime(cumulative_times),
         )
 
@@ -436,7 +774,7 @@ class TimeSet:
                 cumulative_comparison: compare times for cumulative segments
         """
         return self._make_compare_times_from_cumulative_times(
-            self.cumulative_times.loc[which, self.segments].values
+            self.cumulative_values[which].copy()
         )
 
     def _make_balanced_best_compare_times(self) -> Tuple[CompareTime, CompareTime]:
@@ -449,7 +787,7 @@ class TimeSet:
                 segment_comparison: compare times for standalone segments
                 cumulative_comparison: compare times for cumulative segments
         """
-        best_run_times: np.ndarray = self.values[self.best_run_index, :]
+        best_run_times: np.ndarray = self._standalone_values[self.best_run_index, :]
         if np.any(np.isnan(best_run_times)):
             raise ValueError(
                 "BALANCED_BEST can't be used if personal best has any missing segments."
@@ -466,6 +804,28 @@ class TimeSet:
         """
         Makes standalone and cumulative compare times from a specific run index.
 
+        The result is shared between calls until a run is added, so it shouldn't be
+        modified.
+
+        Args:
+            compare_style: the method of comparison
+
+        Returns:
+            (segment_comparison, cumulative_comparison)
+                segment_comparison: compare times for standalone segments
+                cumulative_comparison: compare times for cumulative segments
+        """
+        return self._memoize(
+            f"compare_times_{compare_style}",
+            lambda: self._compute_compare_times(compare_style),
+        )
+
+    def _compute_compare_times(
+        self, compare_style: CompareStyle
+    ) -> Tuple[CompareTime, CompareTime]:
+        """
+        Computes standalone and cumulative compare times (see make_compare_times).
+
         Args:
             compare_style: the method of comparison
 
@@ -504,17 +864,24 @@ class TimeSet:
         """
         Gets the best segment and cumulative times.
 
+        The result is shared between calls until a run is added, so it shouldn't be
+        modified.
+
         Returns:
             (best_segments, best_cumulative):
                 best_segments: Comparison for best standalone times
                 best_cumulative: Comparison for best cumulative times
         """
-        if self:
-            best_segments = CompareTime(self.best_times.values)
-            best_cumulatives = CompareTime(self.best_cumulative_times.values)
-            return (best_segments, best_cumulatives)
-        else:
-            return (CompareTime(None), CompareTime(None))
+
+        def compute() -> Tuple[CompareTime, CompareTime]:
+            if self:
+                best_segments = CompareTime(self.best_times.values)
+                best_cumulatives = CompareTime(self.best_cumulative_times.values)
+                return (best_segments, best_cumulatives)
+            else:
+                return (CompareTime(None), CompareTime(None))
+
+        return self._memoize("best_compare_times", compute)
 
     def make_comparison_set(self, compare_style: CompareStyle) -> ComparisonSet:
         """
@@ -572,43 +939,29 @@ class TimeSet:
         Returns:
             DataFrame with agg functions as columns and segments as rows
         """
+        return self._memoize("standalone_summary", self._make_standalone_summary).copy()
 
-        def make_sort_element(series: pd.Series) -> int:
-            """
-            Makes a value that characterizes where a row should be placed.
-
-            Args:
-                series: DataFrame row, containing column "segment"
-
-            Returns:
-                integer specifying where elements are sorted first by
-                their segment index and then by their value of cumulative
-            """
-            segment: str = series.loc["segment"]
-            if segment == "total":
-                return self.num_segments
-            else:
-                return self.segments.index(segment)
+    def _make_standalone_summary(self) -> pd.DataFrame:
+        """
+        Computes the standalone summary (see standalone_summary).
 
-        SORT_COLUMN: str = "SORTCOLUMNIGNORE"
-        result: pd.DataFrame = self.times[self.segments].agg(AGG_FUNCS)
-        if self.is_multi_segment:
-            result["total"] = result.apply("sum", axis=1)
-            # variance, not standard deviation, is additive
-            result.loc["std", "total"] = np.sqrt(
-                np.sum(result.loc["std", self.segments].values ** 2)
-            )
-            # count don't have meaningful sums over segments
-            result.loc["count", "total"] = result.loc["count", self.segments[-1]]
+        Returns:
+            DataFrame with agg functions as columns and segments as rows
+        """
+        if not self.is_multi_segment:
+            # standalone times are cumulative times, so skip making the times frame
+            return self.cumulative_summary
+        result: pd.DataFrame = aggregate_times(self._standalone_frame[self.segments])
+        result["total"] = result.apply("sum", axis=1)
+        # variance, not standard deviation, is additive
+        result.loc["std", "total"] = np.sqrt(
+            np.sum(result.loc["std", self.segments].values ** 2)
+        )
+        # count don't have meaningful sums over segments
+        result.loc["count", "total"] = result.loc["count", self.segments[-1]]
         result = result.T
         result["count"] = result["count"].astype(int)
-        result.reset_index(inplace=True)
-        result.rename(columns={"index": "segment"}, inplace=True)
-        result[SORT_COLUMN] = result.apply(make_sort_element, axis=1)
-        result.sort_values(SORT_COLUMN, inplace=True)
-        result.drop(columns=SORT_COLUMN, inplace=True)
-        result.set_index("segment", inplace=True)
-        return result
+        return result.reindex(self.segments + ["total"]).rename_axis("segment")
 
     @property
     def cumulative_summary(self) -> pd.DataFrame:
@@ -619,32 +972,36 @@ class TimeSet:
         Returns:
             DataFrame with agg functions as columns and segments as rows
         """
+        return self._memoize("cumulative_summary", self._make_cumulative_summary).copy()
 
-        def make_sort_element(series: pd.Series) -> int:
-            """
-            Makes a value that characterizes where a row should be placed.
-
-            Args:
-                series: DataFrame row, containing column "segment"
-
-            Returns:
-                integer specifying where elements are sorted first by
-                their segment index and then by their value of cumulative
-            """
-            return self.segments.index(series.loc["segment"])
+    def _make_cumulative_summary(self) -> pd.DataFrame:
+        """
+        Computes the cumulative summary (see cumulative_summary).
 
-        SORT_COLUMN: str = "SORTCOLUMNIGNORE"
-        result: pd.DataFrame = self.cumulative_times[self.segments].agg(AGG_FUNCS).T
+        Returns:
+            DataFrame with agg functions as columns and segments as rows
+        """
+        result: pd.DataFrame = aggregate_times(self._cumulative_frame[self.segments]).T
         # sum of cumulative times is not meaningful except for the final segment
         result.loc[self.segments[:-1], "sum"] = np.nan
         result["count"] = result["count"].astype(int)
-        result.reset_index(inplace=True)
-        result.rename(columns={"index": "segment"}, inplace=True)
-        result[SORT_COLUMN] = result.apply(make_sort_element, axis=1)
-        result.sort_values(SORT_COLUMN, inplace=True)
-        result.drop(columns=SORT_COLUMN, inplace=True)
-        result.set_index("segment", inplace=True)
-        return result
+        return result.reindex(self.segments).rename_axis("segment")
+
+    @property
+    def final_cumulative_summary(self) -> pd.Series:
+        """
+        Computes agg functions on the total times of runs, i.e. the final row of
+        cumulative_summary without aggregating the other segments.
+
+        Returns:
+            Series with agg functions as index
+        """
+        return self._memoize(
+            "final_cumulative_summary",
+            lambda: aggregate_times(self._cumulative_frame[self.segments[-1:]])[
+                self.segments[-1]
+            ],
+        ).copy()
 
     def print_detailed_summary(self, print_func: Callable[..., None] = print) -> None:
         """
@@ -680,14 +1037,20 @@ class TimeSet:
             segments = self.segments
         if len(segments) < 2:
             raise ValueError("correlations are not meaningful for single segments.")
-        times: np.ndarray = self.times[segments].values.astype(float)
-        means: np.ndarray = np.mean(times, axis=0, keepdims=True)
-        differences: np.ndarray = times - means
-        covariance: np.ndarray = np.dot(differences.T, differences)
-        variance: np.ndarray = np.diag(covariance)
-        squared_norm: np.ndarray = variance[:, np.newaxis] * variance[np.newaxis, :]
-        correlation: np.ndarray = covariance / np.sqrt(squared_norm)
-        return pd.DataFrame(data=correlation, index=segments, columns=segments)
+
+        def compute() -> pd.DataFrame:
+            times: np.ndarray = self._standalone_values[
+                :, [self.segments.index(segment) for segment in segments]
+            ]
+            # runs that skipped one of these segments can't be correlated over them
+            times = times[~np.isnan(times).any(axis=1)]
+            with warnings.catch_warnings():
+                # too few runs (or constant times) give nan instead of correlations
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                correlation: np.ndarray = np.corrcoef(times, rowvar=False)
+            return pd.DataFrame(data=correlation, index=segments, columns=segments)
+
+        return self._memoize(f"correlations {tuple(segments)!r}", compute).copy()
 
     @property
     def total_time_spent(self) -> float:
@@ -697,4 +1060,19 @@ class TimeSet:
         Returns:
             total number of seconds spend on this task
         """
-        return np.sum(self.values)
+
+        def compute() -> float:
+            values: np.ndarray = self.cumulative_values
+            if values.size == 0:
+                return 0.0
+            # a run's time spent is its last recorded cumulative time, which still
+            # counts the time of any skipped segments before it
+            recorded: np.ndarray = ~np.isnan(values)
+            last: np.ndarray = (values.shape[1] - 1) - np.argmax(
+                recorded[:, ::-1], axis=1
+            )
+            final_times: np.ndarray = values[np.arange(len(values)), last]
+            # runs with no recorded times at all don't add to the total
+            return float(np.nansum(final_times))
+
+        return self._memoize("total_time_spent", compute)
@@ -1,7 +1,7 @@
 import logging
 import os
 import shutil
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Collection, Dict, List, Optional, Set
 from typing_extensions import Self
 import yaml
 
@@ -9,6 +9,9 @@ from cubetime.core.TimeSet import TimeSet
 
 logger = logging.getLogger(__name__)
 
+CONFIG_FILE_NAME: str = "config.yml"
+"""Name of the file (inside its directory) that stores the config of a task."""
+
 
 class TimedTask:
     """
@@ -79,7 +82,7 @@ class TimedTask:
         Returns:
             full path to config file
         """
-        return os.path.join(directory, "config.yml")
+        return os.path.join(directory, CONFIG_FILE_NAME)
 
     @property
     def config_filename(self) -> str:
@@ -91,6 +94,39 @@ class TimedTask:
         """
         return self.make_config_filename(self.directory)
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        The config describing this timed task, as stored in its config file.
+
+        Returns:
+            dictionary of keyword arguments (besides directory) to make this task
+        """
+        return {
+            "name": self.name,
+            "segments": self.segments,
+            "min_best": self.min_best,
+            "aliases": self.aliases,
+        }
+
+    @classmethod
+    def from_config(cls, directory: str, config: Dict[str, Any]) -> Self:
+        """
+        Creates a new TimedTask from its config.
+
+        Args:
+            directory: absolute path to directory with config file
+            config: dictionary in the form returned by the config property (aliases
+                can be any collection)
+
+        Returns:
+            TimedTask stored in directory
+        """
+        kwargs: Dict[str, Any] = dict(config, directory=directory)
+        if kwargs.get("aliases") is not None:
+            kwargs["aliases"] = set(kwargs["aliases"])
+        return cls(**kwargs)
+
     @classmethod
     def from_directory(cls, directory: str) -> Self:
         """
@@ -102,24 +138,17 @@ class TimedTask:
         Returns:
             TimedTask stored in directory
         """
-        kwargs: Dict[str, Any] = {"directory": directory}
         with open(cls.make_config_filename(directory), "r") as file:
-            kwargs.update(yaml.safe_load(file))
+            config: Dict[str, Any] = yaml.safe_load(file)
         logger.debug(f"Loading task from directory {directory}.")
-        return cls(**kwargs)
+        return cls.from_config(directory, config)
 
     def save(self) -> None:
         """
         Saves the config describing this timed task in the directory.
         """
-        to_dump: Dict[str, Any] = {
-            "name": self.name,
-            "segments": self.segments,
-            "min_best": self.min_best,
-            "aliases": self.aliases,
-        }
         with open(self.config_filename, "w") as file:
-            yaml.dump(to_dump, file)
+            yaml.dump(self.config, file)
         return
 
     def add_alias(self, alias: str) -> None:
@@ -137,6 +166,21 @@ class TimedTask:
         self.save()
         return
 
+    def add_aliases(self, aliases: Collection[str]) -> None:
+        """
+        Adds aliases of this task, saving the config only once.
+
+        Throws a ValueError if any of the aliases are the same as the name
+
+        Args:
+            aliases: alternate strings that can be used to refer to this task
+        """
+        if self.name in aliases:
+            raise ValueError("Task alias cannot be identical to name.")
+        self.aliases.update(aliases)
+        self.save()
+        return
+
     def remove_alias(self, alias: str) -> None:
         """
         Removes an alias.
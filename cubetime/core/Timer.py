@@ -23,24 +23,14 @@ class Timer(metaclass=ABCMeta):
         """
         self.segments: List[str] = segments
         self.comparison: ComparisonSet = comparison
-        self._unix_times: Optional[List[float]] = None
-
-    @property
-    def unix_times(self) -> List[float]:
-        """
-        Gets the list of start/end timestamps of current run.
-
-        Returns:
-            List of timestamps [start1, end1, end2, ...]
-        """
-        if self._unix_times is None:
-            self._unix_times = []
-        return self._unix_times
+        # start/end timestamps of current run: [start1, end1, end2, ...]. They come
+        # from the monotonic clock, so only differences between them are meaningful
+        self.clock_times: List[float] = []
 
     def restart(self) -> None:
-        """Sets the unix times to list of one timestamp: now."""
-        self._unix_times = None
-        self.unix_times.append(time.time())
+        """Sets the clock times to list of one monotonic clock reading: now."""
+        self.clock_times.clear()
+        self.clock_times.append(time.monotonic())
         return
 
     def _undo(self, segment_index: int) -> None:
@@ -50,9 +40,9 @@ class Timer(metaclass=ABCMeta):
         Args:
             segment_index: segment currently being timed (the one after the one to undo)
         """
-        self.unix_times.pop()
+        self.clock_times.pop()
         logger.info(f'Undoing finish of {self.segments[segment_index - 1]}')
-        if self.unix_times:
+        if self.clock_times:
             return True
         else:
             self.restart()
@@ -66,11 +56,11 @@ class Timer(metaclass=ABCMeta):
             segment_index: the index of the segment to add
             skipped: if True, nan timestamp is added, otherwise now is added
         """
-        self.unix_times.append(np.nan if skipped else time.time())
+        self.clock_times.append(np.nan if skipped else time.monotonic())
         self.comparison.print_segment_terminal_output(
             segment_index=segment_index,
-            standalone=(self.unix_times[-1] - self.unix_times[-2]),
-            cumulative=(self.unix_times[-1] - self.unix_times[0]),
+            standalone=(self.clock_times[-1] - self.clock_times[-2]),
+            cumulative=(self.clock_times[-1] - self.clock_times[0]),
             print_func=click.echo,
         )
         return
@@ -82,7 +72,7 @@ class Timer(metaclass=ABCMeta):
         Returns:
             True if there is a next segment, False if the timer is finished
         """
-        segment_index: int = len(self.unix_times) - 1
+        segment_index: int = len(self.clock_times) - 1
         try:
             output: str = f"Current segment: {self.segments[segment_index]}"
         except IndexError:
@@ -95,7 +85,7 @@ class Timer(metaclass=ABCMeta):
     @abstractmethod
     def _time(self) -> None:
         """
-        Technique-specific timing method. Should fill unix_times property.
+        Technique-specific timing method. Should fill clock_times property.
 
         NOTE: This is an abstract method that should be overridden by subclass of Timer.
         """
@@ -109,13 +99,17 @@ class Timer(metaclass=ABCMeta):
             times for each of the segments, None if run shouldn't be added
         """
         self._time()
-        if len(self.unix_times) == 0:
+        if len(self.clock_times) == 0:
             logger.warning("Timer was never started in _time method.")
             return None
-        final_times: np.ndarray = np.ones(len(self.segments)) * np.nan
-        final_times[: len(self.unix_times) - 1] = self.unix_times[1:]
-        final_times -= self.unix_times[0]
-        if np.all(np.isnan(final_times)):
+        final_times: np.ndarray = np.full(len(self.segments), np.nan)
+        np.subtract(
+            self.clock_times[1:],
+            self.clock_times[0],
+            out=final_times[: len(self.clock_times) - 1],
+        )
+        # skipped segments are nan, so a run can have timestamps and still be empty
+        if (len(self.clock_times) <= 1) or np.all(np.isnan(final_times)):
             logger.warning(
                 "Not adding new time because run aborted during first segment."
             )
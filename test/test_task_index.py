@@ -0,0 +1,54 @@
+import os
+from typing import List
+
+from cubetime.core.TaskIndex import TaskIndex
+from cubetime.core.TimedTask import TimedTask
+
+
+def test_task_cache_reflects_changes(tmp_path) -> None:
+    """
+    Checks that tasks loaded through the task cache match the stored configs.
+
+    1) Checks that a fresh index loads the tasks from the cache written by another
+    2) Checks that aliases added since the cache was written are loaded
+    3) Checks that tasks added or deleted since the cache was written are found
+
+    Args:
+        tmp_path: temporary directory in which to store the data directory
+    """
+    data_directory: str = os.path.join(tmp_path, "data")
+    writer: TaskIndex = TaskIndex(data_directory)
+    writer.new_timed_task("first", ["a", "b"], aliases=["1"])
+    writer.new_timed_task("second", ["c"], leaf_directory="nested/second")
+    assert sorted(TaskIndex(data_directory).timed_tasks) == ["first", "second"]
+    assert os.path.exists(TaskIndex(data_directory).task_cache_file_name)
+    reader: TaskIndex = TaskIndex(data_directory)
+    assert reader["1"].segments == ["a", "b"]
+    assert reader["second"].min_best
+    writer.add_alias("second", "2")
+    assert TaskIndex(data_directory)["2"].name == "second"
+    writer.new_timed_task("third", ["d"], leaf_directory="nested/third")
+    writer.delete("first")
+    names: List[str] = TaskIndex(data_directory).task_names
+    assert names == ["second", "third"]
+    return
+
+
+def test_task_cache_detects_edit_keeping_modification_time(tmp_path) -> None:
+    """
+    Checks that a config edited within the same clock tick isn't read from the cache.
+
+    Args:
+        tmp_path: temporary directory in which to store the data directory
+    """
+    data_directory: str = os.path.join(tmp_path, "data")
+    writer: TaskIndex = TaskIndex(data_directory)
+    writer.new_timed_task("first", ["a", "b"])
+    assert TaskIndex(data_directory)["first"].min_best
+    task: TimedTask = writer["first"]
+    modified: int = os.stat(task.config_filename).st_mtime_ns
+    task.min_best = False
+    task.save()
+    os.utime(task.config_filename, ns=(modified, modified))
+    assert not TaskIndex(data_directory)["first"].min_best
+    return
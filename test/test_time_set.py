@@ -8,9 +8,12 @@ from typing import List
 
 from cubetime.core.CompareStyle import CompareStyle
 from cubetime.core.CompareTime import CompareTime
-from cubetime.core.TimeSet import SINGLETON_SEGMENT_COLUMN, TimeSet
-
-TEST_FILE_NAME: str = "tempTHISfileSHOULDbeDELETED"
+from cubetime.core.TimeSet import (
+    AGG_FUNCS,
+    aggregate_times,
+    SINGLETON_SEGMENT_COLUMN,
+    TimeSet,
+)
 
 
 @pytest.mark.parametrize(
@@ -20,7 +23,7 @@ def test_time_set_from_data_frame(copy: bool, multi_segment: bool) -> None:
     """
     Creates time set using initializer and tests its properties.
 
-    1) Checks whether copy keyword argument actually causes data frame to be copied
+    1) Checks that the given data frame's times are stored
     2) Checks whether is_multi_segment matches num_segments>1
     3) Checks if segments are taken from columns as expected from data frame
     4) Checks if number of segments is correct
@@ -41,7 +44,7 @@ def test_time_set_from_data_frame(copy: bool, multi_segment: bool) -> None:
     expected_segments = ["first"] + (["second", "third"] if multi_segment else [])
     assert time_set.segments == expected_segments
     assert time_set.is_multi_segment == multi_segment
-    assert (time_set.cumulative_times is cumulative_times) == (not copy)
+    assert time_set.cumulative_times.equals(cumulative_times)
     assert time_set.num_segments == len(expected_segments)
     assert len(time_set) == 2
     assert time_set
@@ -73,13 +76,53 @@ def test_add_row() -> None:
     segments: List[str] = ["first", "second"]
     time_set: TimeSet = TimeSet.create_new(segments)
     time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 20.0]))
     )
     assert len(time_set) == 1
     assert time_set
     return
 
 
+def test_add_rows() -> None:
+    """
+    Tests that adding many rows at once is the same as adding them one at a time.
+    """
+    dates: List[datetime] = [datetime(2023, 1, day) for day in range(1, 21)]
+    cumulative_times: np.ndarray = np.cumsum(
+        np.random.default_rng(0).uniform(5, 10, (20, 2)), axis=1
+    )
+    one_at_a_time: TimeSet = TimeSet.create_new(["first", "second"])
+    for (date, run) in zip(dates, cumulative_times):
+        one_at_a_time.add_row(date=date, cumulative_times=run)
+    all_at_once: TimeSet = TimeSet.create_new(["first", "second"])
+    all_at_once.add_rows(dates[:3], cumulative_times[:3])
+    all_at_once.add_rows(dates[3:], cumulative_times[3:])
+    assert all_at_once == one_at_a_time
+    assert np.allclose(all_at_once.values, one_at_a_time.values)
+    try:
+        all_at_once.add_rows(dates[:2], cumulative_times[:1])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("mismatched dates and times should raise error.")
+    return
+
+
+def test_cumulative_values() -> None:
+    """
+    Tests that cumulative_values matches cumulative_times and can't be modified.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 2.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([np.nan, 4.]))
+    values: np.ndarray = time_set.cumulative_values
+    assert np.array_equal(
+        values, time_set.cumulative_times[time_set.segments].values, equal_nan=True
+    )
+    assert not values.flags.writeable
+    return
+
+
 def test_equality_check() -> None:
     """
     Tests "==" oberator on TimeSet objects. Segments, min_best, and times must be equal.
@@ -89,14 +132,15 @@ def test_equality_check() -> None:
     time_set3: TimeSet = TimeSet.create_new(["first", "Second"], min_best=True)
     time_set4: TimeSet = TimeSet.create_new(["first", "second"], min_best=True)
     time_set4.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 20.0]))
     )
     time_set5: TimeSet = TimeSet.create_new(["first", "second"], min_best=True)
     time_set5.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 20.0]))
     )
-    time_set6 = time_set5.copy()
-    time_set6.cumulative_times.iloc[0,1] = np.nan
+    frame6: pd.DataFrame = time_set5.cumulative_times
+    frame6.iloc[0, 1] = np.nan
+    time_set6: TimeSet = TimeSet(frame6)
     assert time_set1 == time_set1
     assert time_set1 != time_set2
     assert time_set1 != time_set3
@@ -117,7 +161,7 @@ def test_copy() -> None:
     assert time_set == time_set.copy()
     assert time_set == TimeSet.create_new_like(time_set)
     time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 20.0]))
     )
     assert time_set == time_set.copy()
     return
@@ -131,56 +175,101 @@ def test_no_segments_given() -> None:
     return
 
 
-def test_save_and_load() -> None:
+def test_save_and_load(tmp_path) -> None:
     """
     Tests that saving and loading a TimeSet creates an identical object.
+
+    Args:
+        tmp_path: temporary directory in which to save the TimeSet
     """
     segments: List[str] = ["first", "second"]
     time_set: TimeSet = TimeSet.create_new(segments)
     time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 20.0]))
     )
     time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(15, 30, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([15.0, 30.0]))
     )
-    time_set.save(TEST_FILE_NAME)
-    try:
-        assert time_set == TimeSet.load(TEST_FILE_NAME)
-        os.remove(TEST_FILE_NAME)
-    except Exception as exception:
-        os.remove(TEST_FILE_NAME)
-        raise exception
+    file_name: str = os.path.join(tmp_path, "data.parquet")
+    time_set.save(file_name)
+    assert time_set == TimeSet.load(file_name)
     return
 
 
-def test_extreme_run() -> None:
+SMALL_TIME_SET_DATES: List[datetime] = [datetime(2023, 1, day) for day in (1, 2, 3)]
+
+
+@pytest.fixture(scope="module")
+def small_time_set() -> TimeSet:
     """
-    Tests the best_run_index and worst_run_index properties.
+    Makes a small two-segment TimeSet with three runs on SMALL_TIME_SET_DATES.
+
+    The TimeSet is shared by all tests in this module, so tests must not modify it.
     """
     time_set: TimeSet = TimeSet.create_new(["first", "second"])
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 15, 2))
-    )
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 20, 2))
+    time_set.add_rows(
+        dates=SMALL_TIME_SET_DATES,
+        cumulative_times=np.cumsum([[10.0, 15.0], [10.0, 20.0], [15.0, 30.0]], axis=1),
     )
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(15, 30, 2))
-    )
-    assert time_set.best_run_index == 0
-    assert time_set.worst_run_index == 2
+    return time_set
+
+
+def test_extreme_run(small_time_set: TimeSet) -> None:
+    """
+    Tests the best_run_index and worst_run_index properties.
+    """
+    assert small_time_set.best_run_index == 0
+    assert small_time_set.worst_run_index == 2
     return
 
 
 def test_time_spent() -> None:
     """
-    Tests the total_time_spent property, which is the sum of all standalone times.
+    Tests the total_time_spent property, which is the sum of final recorded times.
     """
     time_set: TimeSet = TimeSet.create_new(["first", "second"])
     time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum(np.linspace(10, 15, 2))
+        date=datetime.now(), cumulative_times=np.cumsum(np.array([10.0, 15.0]))
     )
     assert time_set.total_time_spent == 25
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([np.nan, 30.0]))
+    assert time_set.total_time_spent == 55
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([12.0, np.nan]))
+    assert time_set.total_time_spent == 67
+    return
+
+
+def test_cached_results_not_shared() -> None:
+    """
+    Tests that modifying a returned (cached) result doesn't change later results.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_rows(
+        dates=SMALL_TIME_SET_DATES,
+        cumulative_times=np.cumsum([[10.0, 15.0], [10.0, 20.0], [15.0, 30.0]], axis=1),
+    )
+    time_set.best_times.iloc[0] = -99.0
+    assert list(time_set.best_times.values) == [10.0, 15.0]
+    time_set.average_cumulative_times.iloc[0] = -99.0
+    assert time_set.average_cumulative_times.iloc[0] == 35.0 / 3
+    time_set.standalone_summary.loc["first", "min"] = -99.0
+    assert time_set.standalone_summary.loc["first", "min"] == 10.0
+    time_set.correlations().iloc[0, 0] = -99.0
+    assert np.isclose(time_set.correlations().iloc[0, 0], 1.0)
+    return
+
+
+def test_times_edits_not_stored() -> None:
+    """
+    Tests that editing the returned time frames doesn't change the stored runs.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([1.0, 2.0]))
+    assert list(time_set.best_times.values) == [1.0, 1.0]
+    time_set.cumulative_times.iloc[0, 1] = np.nan
+    time_set.times.iloc[0, 1] = np.nan
+    assert list(time_set.cumulative_values[0]) == [1.0, 2.0]
+    assert list(time_set.best_times.values) == [1.0, 1.0]
     return
 
 
@@ -209,16 +298,12 @@ def test_invalid_initializer() -> None:
     return
 
 
-def test_dates() -> None:
+def test_dates(small_time_set: TimeSet) -> None:
     """
-    Tests the dates property to ensure that it contains the dates input by add_row.
+    Tests the dates property to ensure that it contains the dates input by add_rows.
     """
-    time_set: TimeSet = TimeSet.create_new(["first", "second"])
-    date1: datetime = datetime.now()
-    date2: datetime = datetime.now()
-    time_set.add_row(date=date1, cumulative_times=np.cumsum(np.linspace(10, 20, 2)))
-    time_set.add_row(date=date2, cumulative_times=np.cumsum(np.linspace(5, 25, 2)))
-    assert list(time_set.dates) == [np.datetime64(date1), np.datetime64(date2)]
+    expected: np.ndarray = np.array(SMALL_TIME_SET_DATES, dtype="datetime64[ns]")
+    assert np.array_equal(small_time_set.dates, expected)
     return
 
 
@@ -237,23 +322,44 @@ def test_compares_when_empty() -> None:
     return
 
 
-@pytest.fixture
+def test_compare_times_reused_until_run_added() -> None:
+    """
+    Ensures that compare times are only recomputed after a run is added.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([2., 3.]))
+    compares = time_set.make_compare_times(CompareStyle.BEST_RUN)
+    best_compares = time_set.best_compare_times
+    assert time_set.make_compare_times(CompareStyle.BEST_RUN) is compares
+    assert time_set.best_compare_times is best_compares
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 3.]))
+    (standalone, cumulative) = time_set.make_compare_times(CompareStyle.BEST_RUN)
+    assert standalone == CompareTime(np.array([1., 3.]))
+    assert cumulative == CompareTime(np.array([1., 4.]))
+    (standalone, cumulative) = time_set.best_compare_times
+    assert standalone == CompareTime(np.array([1., 3.]))
+    return
+
+
+@pytest.fixture(scope="module")
 def time_set_for_compares() -> TimeSet:
     """
     Makes a TimeSet to use when testing Comparisons.
+
+    The TimeSet is shared by all tests in this module, so tests must not modify it.
     """
     time_set: TimeSet = TimeSet.create_new(["first", "second", "third", "fourth"])
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum([10.0, 20.0, 30.0, 40.0])
-    )
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum([15.0, 15.0, 10.0, 30.0])
+    standalone_times: np.ndarray = np.array(
+        [
+            [10.0, 20.0, 30.0, 40.0],
+            [15.0, 15.0, 10.0, 30.0],
+            [1.0, 60.0, 60.0, 20.0],
+            [60.0, 1.0, 60.0, 10.0],
+        ]
     )
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum([1.0, 60.0, 60.0, 20.0])
-    )
-    time_set.add_row(
-        date=datetime.now(), cumulative_times=np.cumsum([60.0, 1.0, 60.0, 10.0])
+    time_set.add_rows(
+        dates=4 * [datetime.now()],
+        cumulative_times=np.cumsum(standalone_times, axis=1),
     )
     return time_set
 
@@ -279,25 +385,31 @@ def test_none_compares(time_set_for_compares: TimeSet) -> None:
 
 
 @pytest.mark.parametrize(
-    "style,times",
+    "style,times,cumulative_times",
     [
-        (CompareStyle.AVERAGE_SEGMENTS, [21.5, 24.0, 40.0, 25.0]),
-        (CompareStyle.BALANCED_BEST, [13.0, 13.0, 22.0, 22.0]),
-        (CompareStyle.BEST_RUN, [15.0, 15.0, 10.0, 30.0]),
-        (CompareStyle.BEST_SEGMENTS, [1.0, 1.0, 10.0, 10.0]),
-        (CompareStyle.LAST_RUN, [60.0, 1.0, 60.0, 10.0]),
-        (CompareStyle.WORST_RUN, [1.0, 60.0, 60.0, 20.0]),
-        (CompareStyle.WORST_SEGMENTS, [60.0, 60.0, 60.0, 40.0]),
+        (style, np.array(times), np.cumsum(times))
+        for (style, times) in [
+            (CompareStyle.AVERAGE_SEGMENTS, [21.5, 24.0, 40.0, 25.0]),
+            (CompareStyle.BALANCED_BEST, [13.0, 13.0, 22.0, 22.0]),
+            (CompareStyle.BEST_RUN, [15.0, 15.0, 10.0, 30.0]),
+            (CompareStyle.BEST_SEGMENTS, [1.0, 1.0, 10.0, 10.0]),
+            (CompareStyle.LAST_RUN, [60.0, 1.0, 60.0, 10.0]),
+            (CompareStyle.WORST_RUN, [1.0, 60.0, 60.0, 20.0]),
+            (CompareStyle.WORST_SEGMENTS, [60.0, 60.0, 60.0, 40.0]),
+        ]
     ],
 )
 def test_non_none_compares(
-    time_set_for_compares: TimeSet, style: CompareStyle, times: List[float]
+    time_set_for_compares: TimeSet,
+    style: CompareStyle,
+    times: np.ndarray,
+    cumulative_times: np.ndarray,
 ) -> None:
     """
     Tests that the different compare styles produce the expected compares.
     """
     compares = time_set_for_compares.make_compare_times(style)
-    assert compares == (CompareTime(np.array(times)), CompareTime(np.cumsum(times)))
+    assert compares == (CompareTime(times), CompareTime(cumulative_times))
     return
 
 
@@ -356,4 +468,87 @@ def test_correlations() -> None:
     return
 
 
+def test_correlations_after_add_row() -> None:
+    """
+    Tests that correlations are recomputed after a new run is added.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 2.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([2., 1.]))
+    assert np.allclose(time_set.correlations().values, [[1., -1.], [-1., 1.]])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([3., 3.]))
+    assert not np.allclose(time_set.correlations().values, [[1., -1.], [-1., 1.]])
+    return
+
+
+def test_correlations_skip_incomplete_runs() -> None:
+    """
+    Tests that runs with skipped segments are left out of correlations.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 2.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([np.nan, 4.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([2., 1.]))
+    assert np.allclose(time_set.correlations().values, [[1., -1.], [-1., 1.]])
+    return
+
+
+def test_correlations_subset_keeps_runs_skipping_other_segments() -> None:
+    """
+    Tests that a run is only left out of correlations if it skipped a used segment.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second", "third"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 2., 3.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([2., 1., 3.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([3., 6., np.nan]))
+    expected: pd.DataFrame = time_set.times[["first", "second"]].corr()
+    actual: pd.DataFrame = time_set.correlations(["first", "second"])
+    assert np.allclose(actual.values, expected.values)
+    return
+
+
+@pytest.mark.filterwarnings("error")
+def test_correlations_empty() -> None:
+    """
+    Tests that correlations of a TimeSet with no runs are nan without warnings.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    assert np.all(np.isnan(time_set.correlations().values))
+    return
+
+
+def test_final_cumulative_summary() -> None:
+    """
+    Tests that the final cumulative summary skips runs with no final time.
+    """
+    time_set: TimeSet = TimeSet.create_new(["first", "second"])
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([1., 2.]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.array([2., np.nan]))
+    time_set.add_row(date=datetime.now(), cumulative_times=np.cumsum([2., 3.]))
+    expected: pd.Series = time_set.cumulative_times["second"].agg(AGG_FUNCS)
+    pd.testing.assert_series_equal(
+        time_set.final_cumulative_summary, expected, check_dtype=False
+    )
+    return
+
+
+@pytest.mark.filterwarnings("ignore:Mean of empty slice:RuntimeWarning")
+@pytest.mark.parametrize("num_runs", [0, 1, 2, 10])
+def test_aggregate_times(num_runs: int) -> None:
+    """
+    Tests that aggregate_times agrees with pandas' agg, including nan handling.
+
+    Args:
+        num_runs: number of rows in the frame of times to aggregate
+    """
+    values: np.ndarray = np.random.default_rng(0).uniform(1, 10, (num_runs, 3))
+    values[::3, 0] = np.nan
+    values[:, 2] = np.nan
+    frame: pd.DataFrame = pd.DataFrame(values, columns=["first", "second", "third"])
+    pd.testing.assert_frame_equal(
+        aggregate_times(frame), frame.agg(AGG_FUNCS), check_dtype=False
+    )
+    return
+
+
 # TODO: summaries